@@ -0,0 +1,14 @@
+"""
+NCAA Wrestling All-Americans Eligibility Analysis
+==================================================
+Shared building blocks for notebooks/analysis.py (data ingest, caching, helpers).
+
+The computations behind the reports are also usable in-process, without the script's file
+output, prints or charts; every function takes a frame and returns frames or dicts:
+
+    from ncaa_eligibility.ingest import load_results                    # load + clean CSV(s)
+    from ncaa_eligibility.validation import validate_results, drop_invalid
+    from ncaa_eligibility.identity import intern_identities            # adds Wrestler_ID / School_ID
+    from ncaa_eligibility.careers import complete_careers, CareerTable, career_stats, classify_archetypes
+    from ncaa_eligibility.aggregates import chalk_matches, bracket_chalk, school_totals
+"""
@@ -0,0 +1,67 @@
+"""
+Bracket and school aggregates: chalk metrics and school totals
+==============================================================
+Pure functions behind Reports 03 and 04 (notebooks/analysis.py), usable on their own: each takes
+the cleaned results frame (ncaa_eligibility.ingest) and returns a frame or dict, with no files,
+prints or charts.
+
+  chalk_matches(df)   per match (Final, 3rd, 5th, 7th): brackets where both wrestlers finished on their seed
+  bracket_chalk(df)   per (Year, Weight): seed-placement delta sum and exact seed == place matches
+  school_totals(df)   per school: AA count, NC count and seed-placement delta sum
+"""
+
+import numpy as np
+
+# Each match pairs two adjacent places: Final = places 1-2 from seeds 1-2, 3rd = 3-4, 5th = 5-6, 7th = 7-8
+CHALK_MATCHES = {"Final": 1, "3rd": 3, "5th": 5, "7th": 7}
+
+
+def chalk_matches(df):
+    """{match: frame of Year, Weight, Wrestler1 (top place), Wrestler2} for the brackets where both
+    places of the match are present once each and both wrestlers finished on their seed, in
+    (Year, Weight) order."""
+    # Exact seed == place finishes, read straight off the parsed seed column (unseeded never match)
+    seed_matches_place = (df["Seed_Int"] == df["Place"]).fillna(False).astype(bool)
+    matches = {}
+    for match_type, top_place in CHALK_MATCHES.items():
+        in_match = df["Place"].isin([top_place, top_place + 1])
+        match_rows = df[in_match]
+        by_bracket = [match_rows["Year"], match_rows["Weight"]]
+        n_rows = match_rows.groupby(by_bracket)["Place"].transform("size")
+        n_top = (match_rows["Place"] == top_place).groupby(by_bracket).transform("sum")
+        n_exact = seed_matches_place[in_match].groupby(by_bracket).transform("sum")
+        chalk_rows = match_rows[(n_rows == 2) & (n_top == 1) & (n_exact == 2)]
+        chalk_rows = chalk_rows.sort_values(["Year", "Weight", "Place"], kind="stable")
+        top_rows = chalk_rows[chalk_rows["Place"] == top_place]
+        bottom_rows = chalk_rows[chalk_rows["Place"] == top_place + 1]
+        matches[match_type] = top_rows[["Year", "Weight"]].assign(
+            Wrestler1=top_rows["Wrestler"].to_numpy(),
+            Wrestler2=bottom_rows["Wrestler"].to_numpy(),
+        ).reset_index(drop=True)
+    return matches
+
+
+def bracket_chalk(df):
+    """Per (Year, Weight): Sum_Differential (seed-placement delta sum) and Exact_Matches (seed ==
+    place), most chalk first (ascending sum)."""
+    bracket_differential_sum = df.groupby(["Year", "Weight"])["Placement-Seed Delta"].sum().reset_index()
+    bracket_differential_sum.columns = ["Year", "Weight", "Sum_Differential"]
+    exact_match_counts = (
+        (df["Seed_Int"] == df["Place"]).fillna(False).astype(np.int64)
+        .groupby([df["Year"], df["Weight"]]).sum()
+        .reset_index(name="Exact_Matches")
+    )
+    bracket_chalk_analysis = bracket_differential_sum.merge(exact_match_counts, on=["Year", "Weight"])
+    return bracket_chalk_analysis.sort_values("Sum_Differential", ascending=True)
+
+
+def school_totals(df):
+    """Per school: AA_Count, NC_Count (0 if none) and Seed_Diff_Sum (seed-placement delta sum)."""
+    school_aa_count = df.groupby("School", observed=True).size().reset_index(name="AA_Count")
+    school_nc_count = df[df["Place"] == 1].groupby("School", observed=True).size().reset_index(name="NC_Count")
+    school_seed_sum = df.groupby("School", observed=True)["Placement-Seed Delta"].sum().reset_index(name="Seed_Diff_Sum")
+
+    school_stats = school_aa_count.merge(school_nc_count, on="School", how="left")
+    school_stats = school_stats.merge(school_seed_sum, on="School", how="left")
+    school_stats["NC_Count"] = school_stats["NC_Count"].fillna(0).astype(int)
+    return school_stats
@@ -0,0 +1,75 @@
+"""
+Artifact writer: skip unchanged outputs, replace changed ones atomically
+========================================================================
+Every chart, table, include and data file the reports produce is written through here. The new
+content is rendered in memory first and compared (sha256) with the file already on disk:
+
+  - identical content leaves the file alone, so its mtime does not move and the site build and
+    git see nothing to do;
+  - changed or new content is written to a temp file in the same directory and renamed into
+    place, so a reader (or a crashed run) never sees a half-written file.
+
+write_bytes and write_text return True when the file changed (save_figure: the changed paths);
+Pipeline reports the changed outputs per stage.
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+from pathlib import Path
+
+
+def write_bytes(path, data):
+    """Write data to path unless the file already holds exactly that. Returns True if written."""
+    path = Path(path)
+    if file_digest(path) == hashlib.sha256(data).hexdigest():
+        return False
+    atomic_write(path, data)
+    return True
+
+
+def write_text(path, text):
+    """write_bytes for text (UTF-8, newlines as given)."""
+    return write_bytes(path, text.encode("utf-8"))
+
+
+@contextlib.contextmanager
+def open_text(path):
+    """Drop-in for open(path, "w"): collects what is written and hands it to write_text on exit."""
+    buffer = io.StringIO()
+    yield buffer
+    write_text(path, buffer.getvalue())
+
+
+def save_figure(fig, *paths, **savefig_kwargs):
+    """Render a matplotlib figure in memory once (format from the first path's suffix) and
+    write_bytes the same buffer to every path. Returns the paths that changed."""
+    paths = [Path(p) for p in paths]
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=paths[0].suffix.lstrip("."), **savefig_kwargs)
+    data = buffer.getvalue()
+    return [path for path in paths if write_bytes(path, data)]
+
+
+def file_digest(path):
+    """sha256 of the file at path, or None if it does not exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def atomic_write(path, data):
+    """Write data to path via a temp file in the same directory and a rename. The temp name is
+    per process, since parallel stages (or two runs) may write the same path at once; it is
+    removed if the write fails."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".tmp-{os.getpid()}-{path.name}")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
@@ -0,0 +1,147 @@
+"""
+Benchmark: the full analysis on synthetic data at growing scales
+================================================================
+For each scale, writes synthetic results (ncaa_eligibility.synthetic: 2,000 rows x scale), runs
+notebooks/analysis.py on them in a fresh process (--force, serial, stats only unless --charts)
+and reads back the run's trace/trace.json. The stage and phase wall times are tabulated side by
+side with a scaling exponent per section: log(time ratio) / log(rows ratio) over the two largest
+scales that finished, so ~1 is linear and ~2 is quadratic. Sections at 1.5 or more are flagged.
+
+A run that exceeds --budget seconds is stopped and the larger scales are skipped. Results go to
+bench/benchmark.json and bench/benchmark.md (inputs and run outputs under bench/ too).
+
+Usage:
+    python -m ncaa_eligibility.benchmark [--scales 1 10 100 1000] [--budget SECONDS] [--charts]
+"""
+
+import argparse
+import json
+import math
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from ncaa_eligibility.artifacts import write_text
+from ncaa_eligibility.synthetic import write_results
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+ANALYSIS_PATH = ROOT_DIR / "notebooks" / "analysis.py"
+BENCH_DIR = ROOT_DIR / "bench"
+DEFAULT_SCALES = [1, 10, 100, 1000]
+DEFAULT_BUDGET = 1800       # Seconds per analysis run
+MIN_TIMED_S = 0.05          # Sections faster than this at both scales get no exponent (timer noise)
+SUPERLINEAR_EXPONENT = 1.5
+
+
+def run_scale(scale, out_dir, seed=0, budget=DEFAULT_BUDGET, charts=False):
+    """Generate scale x synthetic data, run the analysis on it and return the scale's result:
+    rows, total wall seconds, status ("ok", "timeout" or "failed") and the trace sections."""
+    data_path = out_dir / "data" / f"results_{scale}x.csv"
+    run_dir = out_dir / f"run_{scale}x"
+    start = time.perf_counter()
+    n_rows = write_results(data_path, scale, seed)
+    generate_s = time.perf_counter() - start
+
+    cmd = [sys.executable, str(ANALYSIS_PATH), "--force", "--workers", "1",
+           "--data", str(data_path), "--out", str(run_dir)]
+    if not charts:
+        cmd.append("--stats-only")
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=budget)
+        status = "ok" if proc.returncode == 0 else "failed"
+    except subprocess.TimeoutExpired:
+        proc, status = None, "timeout"
+    wall_s = time.perf_counter() - start
+    if proc is not None:
+        write_text(run_dir / "analysis.log", proc.stdout + proc.stderr)
+
+    sections = []
+    if status == "ok":
+        with open(run_dir / "trace" / "trace.json") as f:
+            sections = json.load(f)["sections"]
+    return {
+        "scale": scale,
+        "rows": n_rows,
+        "status": status,
+        "generate_s": round(generate_s, 3),
+        "wall_s": round(wall_s, 3),
+        "sections": sections,
+    }
+
+
+def section_times(results):
+    """{section label: {scale: wall seconds}} in trace order; phases are labelled stage / phase."""
+    times = {}
+    for result in results:
+        for event in result["sections"]:
+            label = event["name"] if event["cat"] == "stage" else f"{event['parent']} / {event['name']}"
+            times.setdefault(label, {})[result["scale"]] = event["wall_s"]
+    return times
+
+
+def scaling_exponent(result_a, result_b, time_a, time_b):
+    """log(time ratio) / log(rows ratio) between two scales; None when either time is too small
+    to measure."""
+    if time_a is None or time_b is None or max(time_a, time_b) < MIN_TIMED_S or min(time_a, time_b) <= 0:
+        return None
+    return math.log(time_b / time_a) / math.log(result_b["rows"] / result_a["rows"])
+
+
+def benchmark_table(results):
+    """Markdown table: one row per section, wall seconds per scale, scaling exponent."""
+    done = [r for r in results if r["status"] == "ok"]
+    header = ["Section"] + [f"{r['scale']}x ({r['rows']:,} rows)" for r in results] + ["Exponent"]
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    for label, by_scale in section_times(results).items():
+        cells = [f"{by_scale[r['scale']]:.2f}" if r["scale"] in by_scale else r["status"] for r in results]
+        exponent = None
+        if len(done) >= 2:
+            a, b = done[-2], done[-1]
+            exponent = scaling_exponent(a, b, by_scale.get(a["scale"]), by_scale.get(b["scale"]))
+        mark = "" if exponent is None else f"{exponent:.2f}"
+        if exponent is not None and exponent >= SUPERLINEAR_EXPONENT:
+            mark += " **superlinear**"
+        lines.append("| " + " | ".join([label] + cells + [mark]) + " |")
+    totals = [f"{r['wall_s']:.2f}" if r["status"] == "ok" else r["status"] for r in results]
+    lines.append("| " + " | ".join(["**Total run**"] + totals + [""]) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every analysis stage on synthetic data at growing scales.")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES,
+                        help="Scales to run, smallest first (default: 1 10 100 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET,
+                        help=f"Seconds allowed per analysis run; larger scales are skipped after a "
+                             f"timeout (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--charts", action="store_true", help="Draw charts too (default: stats only)")
+    parser.add_argument("--out", type=Path, default=BENCH_DIR, help="Output directory (default: bench/)")
+    args = parser.parse_args(argv)
+
+    results = []
+    for scale in sorted(args.scales):
+        if results and results[-1]["status"] != "ok":
+            print(f"Scale {scale}x: skipped (previous scale {results[-1]['status']})")
+            results.append({"scale": scale, "rows": 2000 * scale, "status": "skipped", "wall_s": None,
+                            "sections": []})
+            continue
+        print(f"Scale {scale}x: running...", flush=True)
+        result = run_scale(scale, args.out, args.seed, args.budget, args.charts)
+        print(f"Scale {scale}x: {result['status']}, {result['rows']:,} rows in {result['wall_s']:.1f}s")
+        results.append(result)
+
+    table = benchmark_table(results)
+    print("\n" + table)
+    json_path = args.out / "benchmark.json"
+    md_path = args.out / "benchmark.md"
+    write_text(json_path, json.dumps({"charts": args.charts, "seed": args.seed, "results": results}, indent=2))
+    write_text(md_path, "# Analysis benchmark (wall seconds per section)\n\n" + table)
+    print(f"Saved: {json_path}")
+    print(f"Saved: {md_path}")
+
+
+if __name__ == "__main__":
+    main()
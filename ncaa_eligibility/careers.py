@@ -0,0 +1,330 @@
+"""
+Careers: complete-career filter and progression archetypes
+==========================================================
+Pure functions behind Report 02 (notebooks/analysis.py), usable on their own: each takes the
+cleaned results frame (ncaa_eligibility.ingest, with Wrestler_ID from ncaa_eligibility.identity)
+and returns frames or dicts, with no files, prints or charts.
+
+  complete_careers(df)          rows of wrestlers whose whole career is observable in the window
+  CareerTable(df)               every wrestler's AAs in career order, from one sort of df
+  classify_archetypes(careers)  one row per wrestler: AA count, archetype flags, Last Chance flags
+  count_archetypes(archetypes)  counts per archetype by AA count (the report_02_stats.json shape)
+  weight_transitions(careers)   consecutive AAs at different weights, and summarize_weight_moves
+  career_stats(careers)         the Report 02 numbers for a set of careers (see ncaa_eligibility.sweep)
+
+The window and completion rules default to CAREER_WINDOW and take other windows, so the same
+filter can be re-run under alternative definitions (ncaa_eligibility.sweep).
+
+Career order is Year, then eligibility order (_order = Year * 10 + eligibility code). Per-wrestler
+consumers read a CareerTable rather than filtering the frame once per wrestler, which would be
+quadratic in the number of wrestlers.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from ncaa_eligibility.schema import ELIGIBILITY_ORDER
+
+# (1) Career complete: exclude those who could still AA in a non-SSr year; include SSr, Sr (any), Jr ≤2022, So ≤2021, Fr ≤2020.
+# (2) Career in window: each AA (Eligibility Year, Year) must satisfy year bounds so the whole career is observable:
+#     Fr:  year-1>=1999 and year+3<=2025  -> 2000<=year<=2022
+#     So:  year-2>=1999 and year+2<=2025  -> 2001<=year<=2023
+#     Jr:  year-3>=1999 and year+1<=2025  -> 2002<=year<=2024
+#     Sr:  year-4>=1999 and year+0<=2025  -> 2003<=year<=2025
+#     SSr: year-5>=1999 and year+0<=2025  -> 2004<=year<=2025 (not used in timeline viz)
+CAREER_WINDOW = (1999, 2025)
+
+
+def elig_year_bounds(window):
+    """Allowed AA years per eligibility class for a career window (lo, hi), as in (2) above."""
+    lo, hi = window
+    return {
+        "Fr":  (lo + 1, hi - 3),   # 2000..2022
+        "So":  (lo + 2, hi - 2),   # 2001..2023
+        "Jr":  (lo + 3, hi - 1),   # 2002..2024
+        "Sr":  (lo + 4, hi),       # 2003..2025
+        "SSr": (lo + 5, hi),       # 2004..2025
+    }
+
+
+def latest_year_complete(window, sr_complete_through=None):
+    """Latest AA year up to which a career is observably complete, by latest eligibility, as in (1)
+    above (None = always complete). We do not exclude based on possible SSr return unless
+    sr_complete_through is set: then a Sr career is complete only if the Sr AA was in or before it."""
+    hi = window[1]
+    return {"Fr": hi - 5, "So": hi - 4, "Jr": hi - 3, "Sr": sr_complete_through, "SSr": None}
+
+
+ELIG_YEAR_BOUNDS = elig_year_bounds(CAREER_WINDOW)
+LATEST_YEAR_COMPLETE = latest_year_complete(CAREER_WINDOW)   # Fr ≤2020, So ≤2021, Jr ≤2022, Sr/SSr any
+
+# Placement archetypes (3+ AAs), counted by AA count; 5+ AAs grouped as 5×
+ARCHETYPE_NAMES = [
+    "Continued Progression", "Plateau Breaker", "Regression Survivor",
+    "Consistent Elite", "Early Peak", "Finish on a Win",
+]
+AA_BUCKETS = ("3", "4", "5")
+# Last Chance (1× AA only)
+LAST_CHANCE_NAMES = ["Senior Last Chance", "COVID Last Chance", "Championship Last Chance"]
+PLACE_PAD = 99  # Pads place matrices past a wrestler's last AA (worse than any place)
+# Weight-change transitions: categories of direction and place_change
+TRANSITION_DIRECTIONS = ["up", "down"]
+PLACE_CHANGES = ["improved", "worse", "same"]
+
+
+def career_fully_in_window(df, bounds=ELIG_YEAR_BOUNDS):
+    """Per wrestler (Series indexed by Wrestler_ID): True if every AA (Eligibility Year, Year) is within
+    bounds. One pass: per-row bounds looked up by eligibility code, then all() per wrestler."""
+    codes = df["Eligibility Year"].cat.codes.to_numpy()
+    # Bounds by eligibility code; unknown eligibility (code -1) picks the trailing (0, 0), never in window
+    lo = np.array([bounds[e][0] for e in ELIGIBILITY_ORDER] + [0])[codes]
+    hi = np.array([bounds[e][1] for e in ELIGIBILITY_ORDER] + [0])[codes]
+    year = df["Year"].to_numpy()
+    in_window = pd.Series((lo <= year) & (year <= hi), index=df.index)
+    return in_window.groupby(df["Wrestler_ID"]).all()
+
+
+def career_is_complete(latest_eligibility, latest_year, latest_complete=LATEST_YEAR_COMPLETE):
+    """True where a wrestler's career is observably complete, from their latest AA's eligibility
+    (categorical Series) and year (aligned Series); a boolean array."""
+    limits = [np.inf if latest_complete[e] is None else latest_complete[e] for e in ELIGIBILITY_ORDER]
+    # Unknown eligibility (code -1) picks the trailing -inf, never complete
+    limit = np.array(limits + [-np.inf])[latest_eligibility.cat.codes.to_numpy()]
+    return latest_year.to_numpy() <= limit
+
+
+def latest_aas(df):
+    """Each wrestler's latest AA row: Wrestler_ID, Eligibility Year, Year."""
+    return df.loc[df.groupby("Wrestler_ID")["Year"].idxmax(), ["Wrestler_ID", "Eligibility Year", "Year"]]
+
+
+def complete_career_ids(df, window=CAREER_WINDOW, sr_complete_through=None, latest=None):
+    """Wrestler_IDs (ascending) whose career is complete and fully in window; latest = latest_aas(df)
+    when already computed."""
+    latest = latest_aas(df) if latest is None else latest
+    complete = pd.Series(
+        career_is_complete(latest["Eligibility Year"], latest["Year"], latest_year_complete(window, sr_complete_through)),
+        index=latest["Wrestler_ID"].to_numpy(),
+    ).sort_index()
+    # Require full career in window: every (Eligibility Year, Year) must be in bounds (excludes e.g. Cael Sanderson: So 2000 < 2001)
+    valid = complete & career_fully_in_window(df, elig_year_bounds(window)).reindex(complete.index)
+    return valid.index[valid.to_numpy()]
+
+
+def complete_careers(df, window=CAREER_WINDOW, sr_complete_through=None):
+    """Rows of df (a copy) for the wrestlers whose career is complete and fully in the window."""
+    return df[df["Wrestler_ID"].isin(complete_career_ids(df, window, sr_complete_through))].copy()
+
+
+class CareerTable:
+    """Every wrestler's AAs in df, grouped by wrestler and in career order: one stable sort by
+    (Wrestler_ID, _order) and the group boundaries, so career(w) is a slice instead of a scan.
+    Wrestlers iterate in first-appearance order in df (like df["Wrestler_ID"].unique())."""
+
+    def __init__(self, df):
+        codes = df["Eligibility Year"].cat.codes.to_numpy()
+        order = df["Year"].to_numpy(dtype=np.int64) * 10 + codes
+        wrestler = df["Wrestler_ID"].to_numpy()
+        perm = np.lexsort((order, wrestler))
+        self.wrestler = wrestler = wrestler[perm]
+        self.year = df["Year"].to_numpy()[perm]
+        self.eligibility = np.asarray(ELIGIBILITY_ORDER, dtype=object)[codes[perm]]
+        self.weight = df["Weight"].to_numpy()[perm]
+        self.place = df["Place"].to_numpy()[perm]
+        self.seed = df["Seed_Int"].to_numpy(dtype=np.float64, na_value=np.nan)[perm]
+        starts = np.flatnonzero(np.r_[True, wrestler[1:] != wrestler[:-1]]) if len(wrestler) else np.empty(0, int)
+        ends = np.r_[starts[1:], len(wrestler)].astype(int)
+        self._slices = {int(w): slice(int(a), int(b)) for w, a, b in zip(wrestler[starts], starts, ends)}
+        self.wrestler_ids = [int(w) for w in pd.unique(df["Wrestler_ID"])]
+
+    def __len__(self):
+        return len(self.wrestler_ids)
+
+    def select(self, wrestler_ids):
+        """The same table restricted to wrestler_ids (in that order); shares the arrays, no re-sort."""
+        table = object.__new__(CareerTable)
+        table.__dict__.update(self.__dict__)
+        table.wrestler_ids = [int(w) for w in wrestler_ids]
+        return table
+
+    def __iter__(self):
+        """(wrestler_id, career) for every wrestler."""
+        for wrestler_id in self.wrestler_ids:
+            yield wrestler_id, self.career(wrestler_id)
+
+    def place_matrix(self):
+        """Places of every wrestler (rows in wrestler_ids order) packed left-aligned into an N x K int
+        matrix, K = most AAs (at least 1), padded with PLACE_PAD; plus the AA counts (length N) and
+        each wrestler's first row in the table's arrays."""
+        first = np.array([self._slices[w].start for w in self.wrestler_ids], dtype=np.int64)
+        n_aa = np.array([self._slices[w].stop - self._slices[w].start for w in self.wrestler_ids], dtype=np.int64)
+        k = max(int(n_aa.max()) if len(n_aa) else 0, 1)
+        offsets = np.arange(k)
+        valid = offsets < n_aa[:, None]
+        rows = np.where(valid, first[:, None] + offsets, 0)
+        places = np.where(valid, self.place[rows], PLACE_PAD).astype(np.int64)
+        return places, n_aa, first
+
+    def career(self, wrestler_id):
+        """One wrestler's AAs in career order: year, eligibility (labels), weight, place and seed
+        (float, NaN = unseeded) arrays of equal length."""
+        rows = self._slices[int(wrestler_id)]
+        return SimpleNamespace(year=self.year[rows], eligibility=self.eligibility[rows],
+                               weight=self.weight[rows], place=self.place[rows], seed=self.seed[rows])
+
+
+def classify_archetypes(careers):
+    """One row per wrestler of a CareerTable (index Wrestler_ID, in its order): n_aa and a boolean
+    column per archetype (ARCHETYPE_NAMES) and Last Chance kind (LAST_CHANCE_NAMES).
+
+    Archetypes 1-6 need 3+ AAs and are numbered in the body below; Last Chance needs exactly one.
+    The rules are evaluated for all wrestlers at once over the padded place matrix
+    (CareerTable.place_matrix): pairs and triples are column-shifted slices, valid only where their
+    last entry is a real AA; "best before" and "best after" are running minimums from the left and
+    right (padding is larger than any place, so it never wins a minimum)."""
+    places, n_aa, first = careers.place_matrix()
+    valid = places != PLACE_PAD
+    rows = np.arange(len(n_aa))
+    three_plus = n_aa >= 3
+    a, b, c = places[:, :-2], places[:, 1:-1], places[:, 2:]   # (i, i + 1, i + 2) for every i
+    triple = valid[:, 2:]
+    best_before = np.minimum.accumulate(places, axis=1)                # min(places[:i + 1])
+    best_after = np.minimum.accumulate(places[:, ::-1], axis=1)[:, ::-1]  # min(places[j:])
+    best_index = places.argmin(axis=1)
+    best = places[rows, best_index]
+    last = places[rows, np.maximum(n_aa - 1, 0)]
+    matched = {
+        # 1. strictly improving each year
+        "Continued Progression": three_plus & (~valid[:, 1:] | (places[:, :-1] > places[:, 1:])).all(axis=1),
+        # 2. 2+ consecutive same placement, then improvement
+        "Plateau Breaker": three_plus & (triple & (a == b) & (c < a)).any(axis=1),
+        # 3. drops 3+ places, then a later AA within 1 of the best before the drop
+        "Regression Survivor": three_plus & (triple & (b - a >= 3) & (best_after[:, 2:] <= best_before[:, :-2] + 1)).any(axis=1),
+        # 4. never won, all placements 2-4
+        "Consistent Elite": three_plus & (~valid | ((places > 1) & (places <= 4))).all(axis=1),
+        # 5. best placement (first occurrence) in the first half, final >= best + 2
+        "Early Peak": three_plus & (best_index < n_aa // 2) & (last >= best + 2),
+        # 6. all odd placements
+        "Finish on a Win": three_plus & (~valid | (places % 2 == 1)).all(axis=1),
+    }
+
+    # 7. Last Chance (1× AA only)
+    one = n_aa == 1
+    elig = careers.eligibility[first]
+    senior = one & np.isin(elig, ["Sr", "SSr"])
+    columns = {"Wrestler_ID": careers.wrestler_ids, "n_aa": n_aa, **matched}
+    columns["Senior Last Chance"] = senior
+    columns["COVID Last Chance"] = one & (elig == "SSr") & (careers.year[first] >= 2021)
+    columns["Championship Last Chance"] = senior & (places[:, 0] == 1)
+    return pd.DataFrame(columns).set_index("Wrestler_ID")
+
+
+def count_archetypes(archetypes):
+    """Counts from classify_archetypes: {archetype: {"by_aa": {"3", "4", "5"}, "total"}} and
+    {"Last Chance": {kind: {"by_aa": {"1"}, "total"}}}, all plain ints (JSON-serializable)."""
+    bucket = archetypes["n_aa"].clip(upper=5).astype(str)
+    counts = {}
+    for name in ARCHETYPE_NAMES:
+        by_aa = {b: int((archetypes[name] & (bucket == b)).sum()) for b in AA_BUCKETS}
+        counts[name] = {"by_aa": by_aa, "total": sum(by_aa.values())}
+    counts["Last Chance"] = {}
+    for name in LAST_CHANCE_NAMES:
+        n = int(archetypes[name].sum())
+        counts["Last Chance"][name] = {"by_aa": {"1": n}, "total": n}
+    return counts
+
+
+def list_archetype_wrestlers(archetypes):
+    """Wrestler IDs per archetype per AA bucket ({name: {"3": [...], ...}}) and per Last Chance
+    kind ({name: [...]}), in classify_archetypes row order."""
+    bucket = archetypes["n_aa"].clip(upper=5).astype(str)
+    by_archetype = {
+        name: {b: archetypes.index[archetypes[name] & (bucket == b)].tolist() for b in AA_BUCKETS}
+        for name in ARCHETYPE_NAMES
+    }
+    last_chance = {name: archetypes.index[archetypes[name]].tolist() for name in LAST_CHANCE_NAMES}
+    return by_archetype, last_chance
+
+
+def weight_transitions(careers):
+    """Consecutive AA pairs where the weight changed, for the wrestlers of a CareerTable (ascending
+    Wrestler_ID, then career order): wrestler_id, from/to weight and place, direction (categorical
+    "up"/"down") and place_change (categorical "improved"/"worse"/"same").
+
+    One pass over the table's (Wrestler_ID, _order) sort: each row is paired with the next (a shift
+    within the wrestler's group) and the pairs where the weight changed are kept."""
+    member = np.isin(careers.wrestler, careers.wrestler_ids)
+    same_wrestler = (careers.wrestler[1:] == careers.wrestler[:-1]) & member[:-1]
+    first = np.flatnonzero(same_wrestler & (careers.weight[1:] != careers.weight[:-1]))
+    second = first + 1
+    from_weight, to_weight = careers.weight[first], careers.weight[second]
+    from_place, to_place = careers.place[first], careers.place[second]
+    direction = np.where(to_weight > from_weight, 0, 1)
+    place_change = np.select([to_place < from_place, to_place > from_place], [0, 1], 2)
+    return pd.DataFrame({
+        "wrestler_id": careers.wrestler[first].astype(np.int64),
+        "from_weight": from_weight.astype(np.int64),
+        "to_weight": to_weight.astype(np.int64),
+        "from_place": from_place.astype(np.int64),
+        "to_place": to_place.astype(np.int64),
+        "direction": pd.Categorical.from_codes(direction, TRANSITION_DIRECTIONS),
+        "place_change": pd.Categorical.from_codes(place_change, PLACE_CHANGES),
+    })
+
+
+def summarize_weight_moves(transitions):
+    """Move counts from weight_transitions: up/down and improved/worse/same per direction, plus the
+    pct_* shares (1 decimal) within each direction. {} when there are no transitions."""
+    if len(transitions) == 0:
+        return {}
+    stats = {"n_transitions": len(transitions)}
+    by_direction = {d: transitions[transitions["direction"] == d] for d in TRANSITION_DIRECTIONS}
+    stats["moves_up"] = int(len(by_direction["up"]))
+    stats["moves_down"] = int(len(by_direction["down"]))
+    for direction, moves in by_direction.items():
+        for change in PLACE_CHANGES:
+            stats[f"{direction}_{change}"] = int((moves["place_change"] == change).sum())
+    for direction, moves in by_direction.items():
+        for change in PLACE_CHANGES:
+            n = stats[f"{direction}_{change}"]
+            stats[f"pct_{direction}_{change}"] = round(100 * n / len(moves), 1) if len(moves) > 0 else 0
+    return stats
+
+
+def improved_every_year(places):
+    """True if placement strictly improved each consecutive year (place values strictly decreasing)."""
+    if len(places) < 2:
+        return False
+    return all(places[i] > places[i + 1] for i in range(len(places) - 1))
+
+
+def career_stats(careers):
+    """The Report 02 numbers for the wrestlers of a CareerTable (report_02_stats.json keys, with
+    counts in place of the name lists): funnel, multi-AA, multi-weight, weight moves, improved
+    every year and archetype counts. All plain ints/floats (JSON-serializable)."""
+    n_aa = np.array([len(career.place) for _, career in careers], dtype=np.int64)
+    n_weights = np.array([len(set(career.weight.tolist())) for _, career in careers], dtype=np.int64)
+    n_unique = len(careers)
+    n_multi_aa = int((n_aa > 1).sum())
+    n_improved = sum(improved_every_year(career.place.tolist()) for _, career in careers)
+    return {
+        "n_complete_careers": n_unique,
+        "n_unique_wrestlers": n_unique,
+        "n_multi_aa": n_multi_aa,
+        "n_multi_weight_aa": int((n_weights >= 2).sum()),
+        "n_improved_every_year": n_improved,
+        "pct_improved_of_multi_aa": round(n_improved / n_multi_aa * 100, 1) if n_multi_aa else 0,
+        "pct_improved_of_all": round(n_improved / n_unique * 100, 1) if n_unique else 0,
+        "funnel": {
+            "all": n_unique,
+            **{f"n_{k}plus": int((n_aa == k).sum()) for k in range(1, 5)},
+            "n_5plus": int((n_aa >= 5).sum()),
+        },
+        "n_five_x_aa": int((n_aa >= 5).sum()),
+        "multi_weight_by_n": {str(k): int((n_weights == k).sum()) for k in (2, 3, 4)},
+        "weight_move_stats": summarize_weight_moves(weight_transitions(careers)),
+        "n_4_weights": int((n_weights == 4).sum()),
+        "archetypes": count_archetypes(classify_archetypes(careers)),
+    }
@@ -0,0 +1,61 @@
+"""
+Wrestler and school identities: dense integer IDs assigned at load
+==================================================================
+IDs are the codes of the Wrestler / School categoricals after dropping unused labels, with
+categories kept in sorted name order. So:
+
+  - IDs are 0..n-1 and index name arrays directly (names[id]);
+  - sorting IDs sorts by name, so sorted(ids) renders in the same order as sorted(names).
+
+Internal structures key on Wrestler_ID / School_ID; names are looked up only when rendering.
+"""
+
+import numpy as np
+
+ID_DTYPE = np.int32
+
+
+class Identities:
+    """Name tables for the wrestler and school IDs of one results frame."""
+
+    def __init__(self, wrestlers, schools):
+        self.wrestlers = np.asarray(wrestlers, dtype=object)
+        self.schools = np.asarray(schools, dtype=object)
+        self._wrestler_ids = None
+
+    def wrestler_name(self, wrestler_id):
+        return self.wrestlers[wrestler_id]
+
+    def wrestler_names(self, wrestler_ids):
+        """Names for a sequence of IDs, in the given order."""
+        return self.wrestlers[np.asarray(wrestler_ids, dtype=np.intp)].tolist()
+
+    def school_name(self, school_id):
+        return self.schools[school_id]
+
+    def wrestler_id(self, name):
+        if self._wrestler_ids is None:
+            self._wrestler_ids = {n: i for i, n in enumerate(self.wrestlers)}
+        return self._wrestler_ids[name]
+
+
+def intern_identities(df):
+    """Add Wrestler_ID / School_ID columns to df and return their name tables. Modifies df in
+    place: the two ID columns are added and Wrestler / School lose unused categories.
+
+    Raises ValueError if any row has no wrestler or school name: its code would be -1, which
+    names[-1] would silently resolve to the last name in the table."""
+    for col in ("Wrestler", "School"):
+        n_missing = int(df[col].isna().sum())
+        if n_missing:
+            raise ValueError(f"{n_missing:,} rows have no {col} name; fix or drop them before interning")
+    names = {}
+    for col in ("Wrestler", "School"):
+        values = df[col].cat.remove_unused_categories()
+        categories = values.cat.categories
+        if not categories.is_monotonic_increasing:
+            values = values.cat.reorder_categories(categories.sort_values())
+        df[col] = values
+        df[f"{col}_ID"] = values.cat.codes.astype(ID_DTYPE)
+        names[col] = values.cat.categories.to_numpy(dtype=object)
+    return Identities(names["Wrestler"], names["School"])
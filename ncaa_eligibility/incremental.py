@@ -0,0 +1,352 @@
+"""
+Incremental aggregates: append a new tournament year without a full rebuild
+===========================================================================
+Persisted, per-year-additive state behind the year-level reports:
+
+  year_elig          AA/NC counts per (Year, Eligibility Year)        -> aa/nc_by_year_elig pivots
+  school_year        AA/NC counts + seed-delta sum per (School, Year)
+  school_cumulative  running AA/NC totals per (School, Year)          -> cumulative_by_year
+  brackets           per (Year, Weight): delta sum, exact seed==place matches, chalk pairs
+  careers            one row per wrestler (counts, latest AA, window bounds, weights, places)
+
+Appending a year only reads that year's rows: they are validated with the same rules as the
+full analysis (ncaa_eligibility.validation; error rows stop the append, unknown eligibility is
+dropped), then the year's pivot rows, brackets and cumulative column are added and career state
+is merged for wrestlers who placed that year. Earlier brackets and untouched careers are never
+recomputed. Tables are stored with the same .npy column layout as the cleaned-data cache.
+
+Scope: this is a standalone store for in-process use (IncrementalAggregates.load / the views
+below) and the CLI; it does not make the reports incremental. notebooks/analysis.py never reads
+it: adding a season to the results CSV changes the data every stage depends on, so the pipeline
+recomputes all of the reports from the full results.
+
+Usage:
+    python -m ncaa_eligibility.incremental build  [--data PATH]
+    python -m ncaa_eligibility.incremental append NEW_YEAR.csv
+"""
+
+import argparse
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ncaa_eligibility.aggregates import CHALK_MATCHES, bracket_chalk, chalk_matches
+from ncaa_eligibility.artifacts import write_text
+from ncaa_eligibility.careers import elig_year_bounds
+from ncaa_eligibility.ingest import clean_results, load_results, read_columns, read_results, write_columns
+from ncaa_eligibility.schema import ELIGIBILITY_DTYPE, ELIGIBILITY_ORDER
+from ncaa_eligibility.validation import YEAR_RANGE, drop_invalid, rows_with, validate_results
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STATE_DIR = ROOT_DIR / "data" / ".aggregates"
+
+# Bump when a table's columns or meaning change (old state must be rebuilt)
+STATE_FORMAT_VERSION = 1
+
+# Per class (ELIGIBILITY_ORDER codes): years back to the implied Fr-1 year and years left to the
+# final non-SSr year, i.e. the career window bounds (ncaa_eligibility.careers) relative to the AA year
+_WINDOW_OFFSETS = elig_year_bounds((0, 0))
+_YEARS_BEFORE = np.array([_WINDOW_OFFSETS[e][0] for e in ELIGIBILITY_ORDER], dtype=np.int16)
+_YEARS_AFTER = np.array([-_WINDOW_OFFSETS[e][1] for e in ELIGIBILITY_ORDER], dtype=np.int16)
+
+TABLES = ("year_elig", "school_year", "school_cumulative", "brackets", "careers")
+
+
+class IncrementalAggregates:
+    """Year-additive aggregates over the cleaned, eligibility-filtered results."""
+
+    def __init__(self, tables=None, years=()):
+        self.tables = tables if tables is not None else _empty_tables()
+        self.years = list(years)
+
+    @classmethod
+    def build(cls, df, year_range=YEAR_RANGE):
+        """Full build: fold every year of df in order (same path as an append). Rows without a Year
+        cannot be folded into any year, so df is validated as a whole first."""
+        df = drop_invalid(df, validate_results(df, year_range=year_range))
+        aggregates = cls()
+        for _, rows in df.groupby("Year", sort=True):
+            aggregates.append_year(rows, year_range)
+        return aggregates
+
+    # --- Append ---
+
+    def append_year(self, rows, year_range=None):
+        """Validate one new year of results and fold it into the aggregates. Raises ValueError if
+        any row violates an "error" rule (nothing is merged). year_range = (first, last) years the
+        validation accepts; by default YEAR_RANGE, extended to the year after the last aggregated
+        one. Returns a summary of what changed."""
+        years = rows["Year"].unique()
+        if len(years) != 1:
+            raise ValueError(f"append_year expects one year of results, got {sorted(int(y) for y in years)}")
+        year = int(years[0])
+        if self.years and year <= self.years[-1]:
+            raise ValueError(f"Year {year} is not after the last aggregated year ({self.years[-1]}); rebuild instead")
+
+        if year_range is None:
+            year_range = (YEAR_RANGE[0], max(YEAR_RANGE[1], self.years[-1] + 1 if self.years else 0))
+        violations = validate_results(rows, year_range=year_range)
+        rows = drop_invalid(rows, violations).copy()
+        rows["Eligibility Year"] = rows["Eligibility Year"].astype(ELIGIBILITY_DTYPE)
+        is_champ = rows["Place"] == 1
+
+        # Year x eligibility counts: one new block of rows
+        year_elig = pd.DataFrame({
+            "Year": np.int16(year),
+            "Eligibility Year": ELIGIBILITY_ORDER,
+            "AA_Count": np.bincount(rows["Eligibility Year"].cat.codes, minlength=len(ELIGIBILITY_ORDER)),
+            "NC_Count": np.bincount(rows.loc[is_champ, "Eligibility Year"].cat.codes,
+                                    minlength=len(ELIGIBILITY_ORDER)),
+        })
+
+        # School counts for the year, then extend every school's running totals by one year
+        by_school = rows.groupby("School", observed=True)
+        school_year = pd.DataFrame({
+            "AA_Count": by_school.size(),
+            "NC_Count": rows[is_champ].groupby("School", observed=True).size(),
+            "Seed_Diff_Sum": by_school["Placement-Seed Delta"].sum(),
+        }).fillna(0).astype(np.int64).rename_axis("School").reset_index()
+        school_year["School"] = school_year["School"].astype(str)
+        school_year.insert(1, "Year", np.int16(year))
+        school_cumulative = self._extend_cumulative(year, school_year)
+
+        self.tables["year_elig"] = _concat(self.tables["year_elig"], year_elig)
+        self.tables["school_year"] = _concat(self.tables["school_year"], school_year)
+        self.tables["school_cumulative"] = school_cumulative
+        new_brackets = bracket_metrics(rows)
+        self.tables["brackets"] = _concat(self.tables["brackets"], new_brackets)
+        n_new, n_updated = self._merge_careers(rows)
+        self.years.append(year)
+        return {
+            "year": year,
+            "rows": len(rows),
+            "warnings": len(rows_with(violations, "warning")),
+            "brackets": len(new_brackets),
+            "schools": len(school_year),
+            "careers_new": n_new,
+            "careers_updated": n_updated,
+        }
+
+    def _extend_cumulative(self, year, school_year):
+        """Running totals through `year`: previous totals + this year's counts, per school."""
+        cum = self.tables["school_cumulative"]
+        if self.years:
+            last = cum[cum["Year"] == self.years[-1]].set_index("School")[["Cum_AA", "Cum_NC"]]
+        else:
+            last = pd.DataFrame(columns=["Cum_AA", "Cum_NC"], dtype=np.int64)
+        this_year = school_year.set_index("School")[["AA_Count", "NC_Count"]]
+        this_year.columns = ["Cum_AA", "Cum_NC"]
+        totals = last.add(this_year, fill_value=0).astype(np.int64).sort_index()
+
+        # Schools appearing for the first time get zero totals for every earlier year
+        first_seen = this_year.index.difference(last.index)
+        backfill = pd.DataFrame({
+            "School": np.repeat(first_seen.to_numpy(dtype=str), len(self.years)),
+            "Year": np.tile(np.array(self.years, dtype=np.int16), len(first_seen)),
+            "Cum_AA": 0,
+            "Cum_NC": 0,
+        })
+        new_year = totals.rename_axis("School").reset_index()
+        new_year.insert(1, "Year", np.int16(year))
+        return _concat(_concat(cum, backfill), new_year)
+
+    def _merge_careers(self, rows):
+        """Merge this year's AAs into career state; only wrestlers who placed are touched."""
+        careers = self.tables["careers"].set_index("Wrestler")
+        new = career_state(rows)
+        touched = new.index.intersection(careers.index)
+        old = careers.loc[touched]
+        upd = new.loc[touched]
+        merged = pd.DataFrame({
+            "AAs": old["AAs"] + upd["AAs"],
+            "NCs": old["NCs"] + upd["NCs"],
+            "First_Year": old["First_Year"],
+            # The appended year is later than anything stored, so its latest AA wins
+            "Latest_Year": upd["Latest_Year"],
+            "Latest_Eligibility": upd["Latest_Eligibility"],
+            "Start_Min": np.minimum(old["Start_Min"], upd["Start_Min"]),
+            "End_Max": np.maximum(old["End_Max"], upd["End_Max"]),
+            "Weights": [_join_sorted(a, b) for a, b in zip(old["Weights"], upd["Weights"])],
+            "Places": old["Places"] + "," + upd["Places"],
+        }, index=touched)
+        careers.loc[touched, merged.columns] = merged
+        first_seen = new.loc[new.index.difference(careers.index)]
+        careers = pd.concat([careers, first_seen]) if len(careers) else first_seen
+        self.tables["careers"] = careers.astype(_CAREER_DTYPES).rename_axis("Wrestler").reset_index()
+        return len(first_seen), len(touched)
+
+    # --- Views in the shape analysis.py builds them ---
+
+    def year_elig_pivot(self, count_col="AA_Count"):
+        """Year x Eligibility Year counts (classes with no rows dropped, as pivot_table observed=True)."""
+        pivot = self.tables["year_elig"].pivot(index="Year", columns="Eligibility Year", values=count_col)
+        pivot = pivot[ELIGIBILITY_ORDER].astype(np.int64)
+        return pivot.loc[:, pivot.sum() > 0]
+
+    def cumulative_by_year(self, schools, cum_col="Cum_AA"):
+        """One row per (School, Year) with the cumulative count up to that year (Report 04 line charts)."""
+        cum = self.tables["school_cumulative"]
+        cum = cum[cum["School"].isin(schools)].set_index(["School", "Year"])[cum_col]
+        index = pd.MultiIndex.from_product([list(schools), self.years], names=["School", "Year"])
+        out = cum.reindex(index, fill_value=0).rename("Cumulative").reset_index()
+        out["Year"] = out["Year"].astype(np.int16)
+        return out
+
+    # --- Persistence ---
+
+    def save(self, state_dir=DEFAULT_STATE_DIR, source=None):
+        """Write every table, then the manifest. The old manifest is removed first and the new one
+        is written atomically last, so a manifest on disk always describes complete tables (a save
+        that fails partway leaves none, and load fails instead of mixing old and new tables)."""
+        state_dir = Path(state_dir)
+        state_dir.mkdir(parents=True, exist_ok=True)
+        (state_dir / "manifest.json").unlink(missing_ok=True)
+        for name in TABLES:
+            write_columns(self.tables[name], state_dir / name)
+        manifest = {"version": STATE_FORMAT_VERSION, "years": self.years}
+        if source is not None:
+            manifest["source"] = str(source)
+        write_text(state_dir / "manifest.json", json.dumps(manifest, indent=2))
+
+    @classmethod
+    def load(cls, state_dir=DEFAULT_STATE_DIR):
+        state_dir = Path(state_dir)
+        with open(state_dir / "manifest.json") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != STATE_FORMAT_VERSION:
+            raise ValueError(f"Aggregate state in {state_dir} is format v{manifest.get('version')}; "
+                             f"rebuild for v{STATE_FORMAT_VERSION}")
+        tables = {name: read_columns(state_dir / name) for name in TABLES}
+        tables["careers"] = tables["careers"].astype(_CAREER_DTYPES)
+        return cls(tables, manifest["years"])
+
+
+# ==============================================================================
+# PER-YEAR BUILDING BLOCKS
+# ==============================================================================
+
+def bracket_metrics(rows):
+    """Per (Year, Weight), in that order: seed-placement delta sum, exact seed == place matches
+    (aggregates.bracket_chalk) and, per chalk match, whether the bracket was chalk there
+    (aggregates.chalk_matches)."""
+    brackets = bracket_chalk(rows).sort_values(["Year", "Weight"], kind="stable").reset_index(drop=True)
+    keys = pd.MultiIndex.from_frame(brackets[["Year", "Weight"]])
+    for name, chalk in chalk_matches(rows).items():
+        brackets[name] = keys.isin(pd.MultiIndex.from_frame(chalk[["Year", "Weight"]]))
+    return brackets
+
+
+_CAREER_DTYPES = {
+    "AAs": np.int64,
+    "NCs": np.int64,
+    "First_Year": np.int16,
+    "Latest_Year": np.int16,
+    "Latest_Eligibility": str,
+    "Start_Min": np.int16,
+    "End_Max": np.int16,
+    "Weights": str,
+    "Places": str,
+}
+
+
+def career_state(rows):
+    """Career state for the wrestlers in rows, indexed by Wrestler.
+
+    Start_Min / End_Max are the earliest implied Fr-1 year and the latest implied final non-SSr
+    year over the wrestler's AAs, so a career lies in window (lo, hi) iff Start_Min >= lo and
+    End_Max <= hi. Places are chronological (Year, then eligibility order)."""
+    codes = rows["Eligibility Year"].cat.codes.to_numpy()
+    year = rows["Year"].to_numpy().astype(np.int16)
+    frame = pd.DataFrame({
+        "Wrestler": rows["Wrestler"].astype(str).to_numpy(),
+        "Year": year,
+        "_order": year.astype(np.int32) * 10 + codes,
+        "Eligibility": np.asarray(ELIGIBILITY_ORDER)[codes],
+        "NC": (rows["Place"] == 1).to_numpy(),
+        "Start": year - _YEARS_BEFORE[codes],
+        "End": year + _YEARS_AFTER[codes],
+        "Weight": rows["Weight"].to_numpy(),
+        "Place": rows["Place"].to_numpy(),
+    }).sort_values(["Wrestler", "_order"], kind="stable")
+    grouped = frame.groupby("Wrestler", sort=True)
+    latest = grouped.tail(1).set_index("Wrestler")
+    state = pd.DataFrame({
+        "AAs": grouped.size(),
+        "NCs": grouped["NC"].sum(),
+        "First_Year": grouped["Year"].min(),
+        "Latest_Year": latest["Year"],
+        "Latest_Eligibility": latest["Eligibility"],
+        "Start_Min": grouped["Start"].min(),
+        "End_Max": grouped["End"].max(),
+        "Weights": grouped["Weight"].agg(lambda w: ",".join(str(v) for v in sorted(set(w)))),
+        "Places": grouped["Place"].agg(lambda p: ",".join(str(v) for v in p)),
+    })
+    return state.astype(_CAREER_DTYPES)
+
+
+def _join_sorted(a, b):
+    return ",".join(str(v) for v in sorted({int(v) for v in f"{a},{b}".split(",")}))
+
+
+def _concat(table, rows):
+    if len(table) == 0:
+        return rows.reset_index(drop=True)
+    if len(rows) == 0:
+        return table
+    return pd.concat([table, rows], ignore_index=True)
+
+
+def _empty_tables():
+    return {
+        "year_elig": pd.DataFrame(columns=["Year", "Eligibility Year", "AA_Count", "NC_Count"]),
+        "school_year": pd.DataFrame(columns=["School", "Year", "AA_Count", "NC_Count", "Seed_Diff_Sum"]),
+        "school_cumulative": pd.DataFrame(columns=["School", "Year", "Cum_AA", "Cum_NC"]),
+        "brackets": pd.DataFrame(columns=["Year", "Weight", "Sum_Differential", "Exact_Matches", *CHALK_MATCHES]),
+        "careers": pd.DataFrame(columns=["Wrestler", *_CAREER_DTYPES]),
+    }
+
+
+# ==============================================================================
+# COMMAND LINE
+# ==============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or incrementally extend the persisted aggregates")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="Rebuild every aggregate from the full results CSV")
+    build.add_argument("--data", type=Path, default=ROOT_DIR / "data" / "raw_data.csv")
+    append = sub.add_parser("append", help="Fold one new year's results (same columns as raw_data.csv)")
+    append.add_argument("new_rows", type=Path)
+    build.add_argument("--year-range", type=int, nargs=2, metavar=("FIRST", "LAST"), default=YEAR_RANGE,
+                       help=f"Years the validation accepts (default: {YEAR_RANGE[0]} {YEAR_RANGE[1]})")
+    append.add_argument("--year-range", type=int, nargs=2, metavar=("FIRST", "LAST"), default=None,
+                        help=f"Years the validation accepts (default: {YEAR_RANGE[0]} through the later of "
+                             f"{YEAR_RANGE[1]} and the year after the last aggregated one)")
+    for p in (build, append):
+        p.add_argument("--state-dir", type=Path, default=DEFAULT_STATE_DIR)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        df, _ = load_results(args.data)
+        aggregates = IncrementalAggregates.build(df, tuple(args.year_range))
+        if args.state_dir.exists():
+            shutil.rmtree(args.state_dir)
+        aggregates.save(args.state_dir, source=args.data)
+        print(f"Built aggregates for {aggregates.years[0]}-{aggregates.years[-1]} "
+              f"({len(aggregates.tables['brackets'])} brackets, {len(aggregates.tables['careers']):,} careers)")
+    else:
+        aggregates = IncrementalAggregates.load(args.state_dir)
+        year_range = None if args.year_range is None else tuple(args.year_range)
+        change = aggregates.append_year(clean_results(read_results(args.new_rows)), year_range)
+        aggregates.save(args.state_dir, source=args.new_rows)
+        print(f"Appended {change['year']}: {change['rows']} AAs, {change['brackets']} brackets, "
+              f"{change['schools']} schools, {change['careers_updated']} careers updated, "
+              f"{change['careers_new']} new ({change['warnings']} rows with validation warnings)")
+    print(f"Saved: {args.state_dir}")
+
+
+if __name__ == "__main__":
+    main()
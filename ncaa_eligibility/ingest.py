@@ -0,0 +1,223 @@
+"""
+Results ingest: load + clean raw_data.csv, with an on-disk columnar cache
+========================================================================
+The source is one CSV, a directory of CSVs or a glob (e.g. one file per season); several
+files are read and cleaned in a process pool and combined in a deterministic order.
+The cleaned frame is cached as one .npy file per column, keyed on a hash of the
+CSV bytes plus the cleaning rules, so unchanged inputs skip parsing and cleaning.
+"""
+
+import glob
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from ncaa_eligibility.schema import ELIGIBILITY_ORDER, RESULTS_DTYPES, SEED_INT_DTYPE, UNSEEDED
+
+# Bump when the on-disk layout changes (invalidates every existing cache entry)
+CACHE_FORMAT_VERSION = 3
+
+
+def read_results(path):
+    """Parse the raw results CSV with the declared schema in one pass."""
+    return pd.read_csv(path, dtype=RESULTS_DTYPES)
+
+
+def clean_results(df):
+    """Standardize eligibility labels, parse Seed into Seed_Int / Unseeded and finish the typed schema."""
+    # Standardize eligibility year (fix casing and whitespace issues). Cleaning the handful of
+    # distinct labels and remapping codes avoids string work on every row.
+    raw = df["Eligibility Year"].cat
+    labels = raw.categories.str.strip().str.title()
+    # Handle edge cases: "Ssr" -> "SSr" (super senior)
+    labels = [("SSr" if label == "Ssr" else label) for label in labels]
+    # Unknown labels are kept (after the known order) so validation can report and drop them
+    extras = sorted(set(labels) - set(ELIGIBILITY_ORDER))
+    categories = ELIGIBILITY_ORDER + extras
+    # Trailing -1: a missing label (code -1) indexes it and stays missing
+    lookup = np.array([categories.index(label) for label in labels] + [-1], dtype=np.int8)
+    df["Eligibility Year"] = pd.Categorical.from_codes(
+        lookup[raw.codes.to_numpy()], dtype=pd.CategoricalDtype(categories, ordered=True)
+    )
+
+    # Seed parsed once for every seed/chalk analysis: numeric seed ("US" -> <NA>) plus the unseeded mask
+    seed = df["Seed"].str.strip()
+    unseeded = (seed.str.upper() == UNSEEDED).fillna(False).astype(bool)
+    numeric = pd.to_numeric(seed.mask(unseeded), errors="coerce")
+    # Values the integer dtype cannot hold (typos like "20000", "3.5") become <NA>, as unparseable
+    # ones do; validation's seed rule reports them from the raw Seed instead of the cast failing
+    limits = np.iinfo(pd.api.types.pandas_dtype(SEED_INT_DTYPE).numpy_dtype)
+    representable = numeric.between(limits.min, limits.max) & (numeric % 1 == 0)
+    df["Seed_Int"] = numeric.where(representable).astype(SEED_INT_DTYPE)
+    df["Unseeded"] = unseeded
+
+    df["Progression Eligible"] = df["Progression Eligible"].astype(bool)
+    return df
+
+
+# ==============================================================================
+# MULTI-FILE SOURCES
+# ==============================================================================
+
+def resolve_sources(source):
+    """Files behind a source: a CSV path, a directory (its *.csv) or a glob pattern. Sorted by path."""
+    source = Path(source)
+    if source.is_dir():
+        paths = sorted(source.glob("*.csv"))
+    elif glob.has_magic(str(source)):
+        paths = sorted(Path(p) for p in glob.glob(str(source)))
+    else:
+        return [source]
+    if not paths:
+        raise FileNotFoundError(f"No CSV files match {source}")
+    return paths
+
+
+def _read_and_clean(path):
+    return clean_results(read_results(path))
+
+
+def combine_results(frames):
+    """Concatenate cleaned per-file frames into one frame in a deterministic row order.
+
+    Categoricals are unioned with the categories a single read_csv would produce (sorted labels;
+    eligibility in ELIGIBILITY_ORDER + sorted extras). Rows follow the source-wide Index when it is
+    unique across files; otherwise they are ordered by (Year, Weight, Place) in file order and
+    Index is renumbered 1..n, as in a single raw_data.csv."""
+    df = pd.concat(frames, ignore_index=True)
+    for col in ("Wrestler", "School"):
+        df[col] = union_categoricals([f[col] for f in frames], sort_categories=True)
+    labels = pd.concat([f["Eligibility Year"].astype(object) for f in frames], ignore_index=True)
+    extras = sorted(set(labels.dropna()) - set(ELIGIBILITY_ORDER))
+    df["Eligibility Year"] = pd.Categorical(labels, categories=ELIGIBILITY_ORDER + extras, ordered=True)
+
+    if df["Index"].is_unique:
+        df = df.sort_values("Index", kind="stable", ignore_index=True)
+    else:
+        df = df.sort_values(["Year", "Weight", "Place"], kind="stable", ignore_index=True)
+        df["Index"] = np.arange(1, len(df) + 1, dtype=RESULTS_DTYPES["Index"])
+    return df
+
+
+def read_clean_sources(paths, workers=None):
+    """Read + clean each file (in a process pool when there are several) and combine them."""
+    if len(paths) == 1:
+        return _read_and_clean(paths[0])
+    # map() yields in submission order, so completion order never affects the result
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        frames = list(pool.map(_read_and_clean, paths))
+    return combine_results(frames)
+
+
+# ==============================================================================
+# CACHE
+# ==============================================================================
+
+def cache_key(paths):
+    """Hash of the CSV names + bytes + the schema and cleaning code + cache layout version."""
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_FORMAT_VERSION}\n".encode())
+    h.update(repr((RESULTS_DTYPES, ELIGIBILITY_ORDER, UNSEEDED, SEED_INT_DTYPE)).encode())
+    for func in (read_results, clean_results, combine_results):
+        h.update(inspect.getsource(func).encode())
+    for path in paths:
+        h.update(f"\n{Path(path).name}\n".encode())
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+def write_columns(df, entry_dir):
+    """Write df as one .npy per column plus a meta.json (column order and kinds).
+    Written to a temp dir and renamed into place so a crashed run never leaves a partial entry."""
+    entry_dir = Path(entry_dir)
+    entry_dir.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(dir=entry_dir.parent, prefix=".tmp-"))
+    meta = {"n_rows": len(df), "columns": []}
+    for i, col in enumerate(df.columns):
+        series = df[col]
+        fname = f"col_{i:02d}.npy"
+        entry = {"name": col, "file": fname}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Codes + categories; categories as fixed-width unicode so np.load never needs pickle
+            np.save(tmp_dir / fname, series.cat.codes.to_numpy())
+            np.save(tmp_dir / f"col_{i:02d}.categories.npy", series.cat.categories.to_numpy(dtype=str))
+            entry.update(kind="category", ordered=bool(series.cat.ordered))
+        elif isinstance(series.dtype, pd.api.extensions.ExtensionDtype) and series.dtype.kind in "iu":
+            # Nullable integer: filled values + mask
+            np.save(tmp_dir / fname, series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0))
+            np.save(tmp_dir / f"col_{i:02d}.mask.npy", series.isna().to_numpy())
+            entry.update(kind="nullable", dtype=str(series.dtype))
+        elif pd.api.types.is_string_dtype(series):
+            # Fixed-width unicode + mask (a missing value would otherwise be stored as the string "nan")
+            np.save(tmp_dir / fname, series.fillna("").to_numpy(dtype=str))
+            np.save(tmp_dir / f"col_{i:02d}.mask.npy", series.isna().to_numpy())
+            entry.update(kind="str")
+        else:
+            np.save(tmp_dir / fname, series.to_numpy())
+            entry.update(kind="numpy")
+        meta["columns"].append(entry)
+    with open(tmp_dir / "meta.json", "w") as f:
+        json.dump(meta, f, indent=2)
+    if entry_dir.exists():
+        shutil.rmtree(entry_dir)
+    os.replace(tmp_dir, entry_dir)
+
+
+def read_columns(entry_dir):
+    """Inverse of write_columns."""
+    entry_dir = Path(entry_dir)
+    with open(entry_dir / "meta.json") as f:
+        meta = json.load(f)
+    data = {}
+    for col in meta["columns"]:
+        values = np.load(entry_dir / col["file"], allow_pickle=False)
+        if col["kind"] == "category":
+            categories = np.load(entry_dir / col["file"].replace(".npy", ".categories.npy"), allow_pickle=False)
+            values = pd.Categorical.from_codes(
+                values, dtype=pd.CategoricalDtype(categories.astype(object), ordered=col["ordered"])
+            )
+        elif col["kind"] == "nullable":
+            mask = np.load(entry_dir / col["file"].replace(".npy", ".mask.npy"), allow_pickle=False)
+            values = pd.array(values, dtype=col["dtype"])
+            values[mask] = pd.NA
+        elif col["kind"] == "str":
+            mask = np.load(entry_dir / col["file"].replace(".npy", ".mask.npy"), allow_pickle=False)
+            values = values.astype(object)
+            values[mask] = np.nan
+        data[col["name"]] = values
+    return pd.DataFrame(data, columns=[c["name"] for c in meta["columns"]])
+
+
+def load_results(source, cache_dir=None, workers=None):
+    """Return (cleaned results frame, from_cache).
+    source is a CSV, a directory of CSVs or a glob; several files are read and cleaned in a
+    process pool of `workers` processes (default: one per core).
+    With cache_dir set, a cleaned copy is stored under cache_dir/<key>/ and reused while
+    neither the CSVs nor the cleaning rules change. Stale entries are removed on write."""
+    paths = resolve_sources(source)
+    if cache_dir is None:
+        return read_clean_sources(paths, workers), False
+
+    cache_dir = Path(cache_dir)
+    key = cache_key(paths)
+    stem = Path(source).stem if len(paths) == 1 or Path(source).is_dir() else "glob"
+    entry_dir = cache_dir / f"{stem}-{key[:16]}"
+    if (entry_dir / "meta.json").exists():
+        return read_columns(entry_dir), True
+
+    df = read_clean_sources(paths, workers)
+    for stale in cache_dir.glob(f"{stem}-*"):
+        shutil.rmtree(stale, ignore_errors=True)
+    write_columns(df, entry_dir)
+    return df, False
@@ -0,0 +1,270 @@
+"""
+Stage graph: named pipeline stages with fingerprinted incremental rebuilds
+=========================================================================
+A stage is a function plus what it depends on:
+
+  inputs   upstream stage names; their return values are the function's arguments, in order
+  outputs  files the stage writes (a missing or modified one makes the stage run again)
+  code     package functions the stage calls; the source of their modules is part of its code
+  params   callable returning JSON-able values the stage reads besides its inputs (data hashes)
+
+A stage's fingerprint hashes its own source, its code, its params, the shared module source
+(configuration, plot style, the graph itself) and its inputs' fingerprints, so an edit
+propagates to the stages downstream of it and no further. Pipeline.run skips every stage
+whose fingerprint matches the last successful run and whose outputs all exist with the content
+it recorded for them (an output edited or deleted by hand runs the stage again). Return values
+of stages with dependents are pickled, so a stage that does run reads its upstream values
+back instead of recomputing them.
+
+With workers > 1, independent stages (e.g. the four reports once clean data exists) run in a
+process pool. Workers write their own outputs and hand back their value, captured stdout and
+output hashes; the parent merges these into the one manifest (state_dir/manifest.json).
+
+Output hashes taken before and after each stage give Pipeline.changed: the declared outputs
+whose content a run actually changed (see ncaa_eligibility.artifacts). Each stage that runs is
+a traced section (ncaa_eligibility.tracing); Pipeline.trace holds the run's events.
+"""
+
+import contextlib
+import hashlib
+import inspect
+import io
+import json
+import os
+import pickle
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from ncaa_eligibility.artifacts import atomic_write, file_digest
+from ncaa_eligibility.tracing import section, take_events
+
+# Bump when the manifest or value layout changes (old state is ignored)
+STATE_FORMAT_VERSION = 2
+
+
+class Stage:
+    """One named step of a Pipeline (see module docstring for the fields)."""
+
+    def __init__(self, name, func, inputs=(), outputs=(), code=(), params=None):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = [Path(p) for p in outputs]
+        self.code = list(code)
+        self.params = params
+
+
+class Pipeline:
+    """Stages in dependency order, with run state (fingerprints + values) under state_dir."""
+
+    def __init__(self, stages, state_dir=None, shared=""):
+        self.stages = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            unknown = [name for name in stage.inputs if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage {stage.name!r} depends on {unknown}, which must be declared before it")
+            self.stages[stage.name] = stage
+        self.state_dir = None if state_dir is None else Path(state_dir)
+        self.shared = shared
+        self.changed = {}  # Last run: {stage name: [output paths whose content changed]}
+        self.trace = []    # Last run: section events of the stages that ran (and their phases)
+
+    def fingerprints(self):
+        """Fingerprint of every stage, keyed by name."""
+        shared = hashlib.sha256(self.shared.encode()).hexdigest()
+        fingerprints = {}
+        for stage in self.stages.values():
+            h = hashlib.sha256()
+            h.update(f"v{STATE_FORMAT_VERSION}\n{shared}\n".encode())
+            h.update(inspect.getsource(stage.func).encode())
+            modules = {inspect.getmodule(obj) for obj in stage.code}
+            for module in sorted(modules, key=lambda m: m.__name__):
+                h.update(inspect.getsource(module).encode())
+            if stage.params is not None:
+                h.update(json.dumps(stage.params(), sort_keys=True, default=str).encode())
+            for name in stage.inputs:
+                h.update(fingerprints[name].encode())
+            fingerprints[stage.name] = h.hexdigest()
+        return fingerprints
+
+    def upstream(self, names):
+        """names plus every stage they depend on, in declaration order."""
+        needed = set()
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage: {name}")
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.stages[name].inputs)
+        return [name for name in self.stages if name in needed]
+
+    def plan(self, targets=None, force=False):
+        """Names of the stages run() would execute (stale ones among targets and their upstream)."""
+        selected = self.upstream(targets) if targets else list(self.stages)
+        return self._stale_stages(selected, self.fingerprints(), self._read_state(), force)
+
+    def run(self, targets=None, force=False, workers=1, initializer=None, initargs=()):
+        """Run the stale stages among targets (default: all) and their upstream stages.
+        With workers > 1 (None = one per core), stages whose inputs are ready run at the same time
+        in a process pool; each stage's printed output is replayed in declaration order, so stdout
+        and output files match a serial run. initializer(*initargs) runs in each worker first (e.g.
+        to apply the caller's configuration). Returns {stage name: "ran" | "skipped"}."""
+        selected = self.upstream(targets) if targets else list(self.stages)
+        fingerprints = self.fingerprints()
+        state = self._read_state()
+        stale = self._stale_stages(selected, fingerprints, state, force)
+        self.changed = {}
+        self.trace = []
+        workers = min(workers or os.cpu_count() or 1, len(stale))
+        if workers > 1:
+            return self._run_parallel(selected, stale, fingerprints, state, workers, initializer, initargs)
+
+        values = {}
+        status = {}
+        for name in selected:
+            if name not in stale:
+                status[name] = "skipped"
+                print(f"[{name}] unchanged, skipped")
+                continue
+            stage = self.stages[name]
+            before = _hash_outputs(stage.outputs)
+            args = [self._input_value(upstream, values) for upstream in stage.inputs]
+            with section(name, cat="stage"):
+                value = stage.func(*args)
+            self.trace.extend(take_events())
+            self._record(name, value, before, _hash_outputs(stage.outputs), fingerprints, state, values)
+            status[name] = "ran"
+        return status
+
+    # --- Internals ---
+
+    def _run_parallel(self, selected, stale, fingerprints, state, workers, initializer, initargs):
+        values = {}
+        status = {name: "skipped" for name in selected if name not in stale}
+        logs = {}
+        before = {}
+        pending = list(stale)
+        running = {}
+        shown = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as pool:
+            while pending or running:
+                busy = set(pending) | set(running.values())
+                for name in [n for n in pending if not busy & set(self.stages[n].inputs)]:
+                    stage = self.stages[name]
+                    args = [self._input_value(upstream, values) for upstream in stage.inputs]
+                    before[name] = _hash_outputs(stage.outputs)
+                    running[pool.submit(_run_stage, name, stage.func, args, stage.outputs)] = name
+                    pending.remove(name)
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    value, logs[name], artifacts, events = future.result()
+                    self.trace.extend(events)
+                    self._record(name, value, before[name], artifacts, fingerprints, state, values)
+                    status[name] = "ran"
+                # Replay output in declaration order, up to the first stage still running
+                while shown < len(selected) and selected[shown] in status:
+                    name = selected[shown]
+                    if status[name] == "skipped":
+                        print(f"[{name}] unchanged, skipped")
+                    else:
+                        sys.stdout.write(logs[name])
+                    sys.stdout.flush()
+                    shown += 1
+        return {name: status[name] for name in selected}
+
+    def _stale_stages(self, selected, fingerprints, state, force):
+        stale = set()
+        for name in selected:
+            outputs_exist = all(path.exists() for path in self.stages[name].outputs)
+            # An output edited or replaced since the stage wrote it no longer matches its recorded hash
+            recorded = state["artifacts"].get(name, {})
+            outputs_current = all(file_digest(path) == digest for path, digest in recorded.items())
+            if (force or state["stages"].get(name) != fingerprints[name]
+                    or not outputs_exist or not outputs_current):
+                stale.add(name)
+        # A stage that runs needs its inputs' values: upstream stages without a saved value run too
+        for name in reversed(selected):
+            if name in stale:
+                for upstream in self.stages[name].inputs:
+                    path = self._value_path(upstream)
+                    if path is None or not path.exists():
+                        stale.add(upstream)
+        return [name for name in selected if name in stale]
+
+    def _dependents(self, name):
+        return [stage.name for stage in self.stages.values() if name in stage.inputs]
+
+    def _input_value(self, name, values):
+        """Return value of an upstream stage: this run's, or the one saved by an earlier run."""
+        if name not in values:
+            with open(self._value_path(name), "rb") as f:
+                values[name] = pickle.load(f)
+        return values[name]
+
+    def _record(self, name, value, before, artifacts, fingerprints, state, values):
+        """Keep a finished stage's value and save it with its fingerprint and output hashes
+        (before = the hashes from just before it ran, for Pipeline.changed)."""
+        values[name] = value
+        self.changed[name] = [path for path, digest in artifacts.items() if before.get(path) != digest]
+        if self.state_dir is None:
+            return
+        if self._dependents(name):
+            atomic_write(self._value_path(name), pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        # Recorded after each stage, so an interrupted run keeps the stages that finished
+        state["stages"][name] = fingerprints[name]
+        state["artifacts"][name] = artifacts
+        atomic_write(self.state_dir / "manifest.json", json.dumps(state, indent=2).encode())
+
+    def _value_path(self, name):
+        return None if self.state_dir is None else self.state_dir / "values" / f"{name}.pkl"
+
+    def _read_state(self):
+        """Last run's manifest: stage fingerprints and the output hashes of each stage."""
+        state = {"version": STATE_FORMAT_VERSION, "stages": {}, "artifacts": {}}
+        if self.state_dir is None:
+            return state
+        try:
+            with open(self.state_dir / "manifest.json") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return state
+        if saved.get("version") != STATE_FORMAT_VERSION:
+            return state
+        state.update(stages=saved.get("stages", {}), artifacts=saved.get("artifacts", {}))
+        return state
+
+
+def shared_source(path, funcs):
+    """Source of the file at path with the definitions of funcs cut out: the module-level code
+    every stage shares (imports, configuration, plot style, the stage graph)."""
+    lines = Path(path).read_text().splitlines(keepends=True)
+    skip = set()
+    for func in funcs:
+        body, start = inspect.getsourcelines(func)
+        skip.update(range(start - 1, start - 1 + len(body)))
+    return "".join(line for i, line in enumerate(lines) if i not in skip)
+
+
+def _hash_outputs(outputs):
+    """sha256 of each output file the stage wrote, keyed by path."""
+    hashes = {}
+    for path in outputs:
+        digest = file_digest(path)
+        if digest is not None:
+            hashes[str(path)] = digest
+    return hashes
+
+
+def _run_stage(name, func, args, outputs):
+    """Worker side of a parallel run: the stage's value, its captured stdout, its output hashes
+    and its trace events."""
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer), section(name, cat="stage"):
+        value = func(*args)
+    return value, buffer.getvalue(), _hash_outputs(outputs), take_events()
@@ -0,0 +1,37 @@
+"""
+Declared ingest schema for raw_data.csv
+=======================================
+Column dtypes applied by the single read_csv pass in ncaa_eligibility.ingest.
+"""
+
+import pandas as pd
+
+# Eligibility year order (for consistent plotting); also the ordered categorical's categories
+ELIGIBILITY_ORDER = ["Fr", "So", "Jr", "Sr", "SSr"]
+
+# Seed label for unseeded wrestlers (Unseeded is True and Seed_Int is <NA> for these rows)
+UNSEEDED = "US"
+
+# Parsed directly by read_csv. Wrestler/School become categoricals (integer codes for every
+# groupby/isin); Eligibility Year is read as a raw categorical and ordered in clean_results
+# once its labels are standardized. Seed stays a string because it holds "US" as well as numbers.
+# Year, Weight and Place are read as nullable ints so a blank value reaches validation (which
+# reports it as an error) instead of failing the parse; drop_invalid casts them to KEY_DTYPES.
+RESULTS_DTYPES = {
+    "Index": "int32",
+    "Year": "Int16",
+    "Weight": "Int16",
+    "Place": "Int8",
+    "Wrestler": "category",
+    "School": "category",
+    "Seed": "str",
+    "Placement-Seed Delta": "int64",  # summed per year/bracket/school; keep headroom
+    "Eligibility Year": "category",
+    "AAs": "int8",
+}
+
+# Dtypes of the bracket-key columns once validated (no missing values)
+KEY_DTYPES = {"Year": "int16", "Weight": "int16", "Place": "int8"}
+
+ELIGIBILITY_DTYPE = pd.CategoricalDtype(ELIGIBILITY_ORDER, ordered=True)
+SEED_INT_DTYPE = "Int16"  # Seed_Int, derived in clean_results alongside the boolean Unseeded mask
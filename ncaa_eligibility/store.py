@@ -0,0 +1,189 @@
+"""
+Results lookups: in-memory frame or an indexed SQLite store
+===========================================================
+Report sections pull their per-bracket and per-place inputs (one bracket's placers, all
+champions) through the same small interface, backed either by boolean scans over the cleaned
+frame or by a local SQLite file with indexes on (Year, Weight) and Place, so each lookup is an
+index seek instead of a full scan. Per-wrestler and per-school inputs come from
+ncaa_eligibility.careers.CareerTable and the school aggregates instead.
+
+Rows come back in frame order with the frame's index labels and dtypes, so either backend
+gives identical report output. Both backends are context managers; close() releases the SQLite
+connection.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+TABLE = "results"
+INDEXES = {
+    "idx_results_bracket": ["Year", "Weight"],
+    "idx_results_place": ["Place"],
+}
+
+
+class FrameResults:
+    """Lookups as boolean scans over the in-memory frame."""
+
+    def __init__(self, df):
+        self.df = df
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Nothing to release (same interface as ResultsStore)."""
+
+    def bracket(self, year, weight):
+        return self.df[(self.df["Year"] == year) & (self.df["Weight"] == weight)]
+
+    def place(self, place):
+        return self.df[self.df["Place"] == place]
+
+
+class ResultsStore:
+    """Lookups as indexed queries against a SQLite copy of the cleaned frame."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        self.key = meta["key"]
+        self.index_name = json.loads(meta["index_name"])
+        self.columns = json.loads(meta["columns"])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the SQLite connection."""
+        self.conn.close()
+
+    @classmethod
+    def materialize(cls, df, path):
+        """Write df to a SQLite file at path (skipped when it already holds the same frame)."""
+        path = Path(path)
+        key = frame_key(df)
+        if path.exists():
+            try:
+                store = cls(path)
+                if store.key == key:
+                    return store
+                store.close()
+            except (sqlite3.Error, KeyError):
+                pass
+
+        # Built beside the target and renamed into place so a crashed run never leaves a partial store;
+        # per-process temp name, since parallel stages may materialize the same store at once
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".tmp-{os.getpid()}-{path.name}")
+        tmp_path.unlink(missing_ok=True)
+        columns = [_column_spec(name, df[name]) for name in df.columns]
+        conn = sqlite3.connect(tmp_path)
+        with conn:
+            col_defs = ", ".join(f"{_quote(c['name'])} {c['sql']}" for c in columns)
+            conn.execute(f"CREATE TABLE {TABLE} (row_id INTEGER PRIMARY KEY, {col_defs})")
+            placeholders = ", ".join("?" * (len(columns) + 1))
+            conn.executemany(f"INSERT INTO {TABLE} VALUES ({placeholders})", _sql_rows(df))
+            for name, cols in INDEXES.items():
+                if not set(cols) <= set(df.columns):
+                    continue
+                conn.execute(f"CREATE INDEX {name} ON {TABLE} ({', '.join(_quote(c) for c in cols)})")
+            conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+            conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+                ("key", key),
+                ("index_name", json.dumps(df.index.name)),
+                ("columns", json.dumps(columns)),
+            ])
+        conn.close()
+        os.replace(tmp_path, path)
+        return cls(path)
+
+    def query(self, where="", params=()):
+        """Rows matching a SQL WHERE clause, as a frame in the original row order."""
+        sql = f"SELECT * FROM {TABLE}" + (f" WHERE {where}" if where else "") + " ORDER BY row_id"
+        rows = self.conn.execute(sql, params).fetchall()
+        return self._to_frame(rows)
+
+    def bracket(self, year, weight):
+        return self.query("Year = ? AND Weight = ?", (int(year), int(weight)))
+
+    def place(self, place):
+        return self.query("Place = ?", (int(place),))
+
+    def _to_frame(self, rows):
+        values = list(zip(*rows)) if rows else [()] * (len(self.columns) + 1)
+        index = pd.Index(np.array(values[0], dtype=np.int64), name=self.index_name)
+        data = {c["name"]: _restore(c, values[i + 1]) for i, c in enumerate(self.columns)}
+        return pd.DataFrame(data, index=index, columns=[c["name"] for c in self.columns])
+
+
+def open_results(df, store_path=None):
+    """Lookup backend for df: the SQLite store at store_path, or scans over df when it is None.
+    Use it as a context manager (or call close()) so the store's connection is released."""
+    if store_path is None:
+        return FrameResults(df)
+    return ResultsStore.materialize(df, store_path)
+
+
+def frame_key(df):
+    """Content hash of df (values, index and dtypes); the store is rebuilt when it changes."""
+    h = hashlib.sha256()
+    h.update(repr([(c, str(df[c].dtype)) for c in df.columns]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _column_spec(name, series):
+    """SQL type and dtype metadata for restoring the column on read (mirrors the cache kinds)."""
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return {"name": name, "sql": "TEXT", "kind": "category",
+                "categories": [str(c) for c in dtype.categories], "ordered": bool(dtype.ordered)}
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) and dtype.kind in "iu":
+        return {"name": name, "sql": "INTEGER", "kind": "nullable", "dtype": str(dtype)}
+    if pd.api.types.is_bool_dtype(dtype):
+        return {"name": name, "sql": "INTEGER", "kind": "bool"}
+    if pd.api.types.is_string_dtype(dtype):
+        return {"name": name, "sql": "TEXT", "kind": "str"}
+    sql = "REAL" if dtype.kind == "f" else "INTEGER"
+    return {"name": name, "sql": sql, "kind": "numpy", "dtype": str(dtype)}
+
+
+def _sql_rows(df):
+    cols = [df.index.to_numpy(dtype=np.int64).tolist()]
+    for name in df.columns:
+        series = df[name]
+        if isinstance(series.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(series.dtype):
+            cols.append([None if pd.isna(v) else str(v) for v in series.astype(object)])
+        else:
+            cols.append([None if pd.isna(v) else v for v in series.astype(object).tolist()])
+    return zip(*cols)
+
+
+def _restore(spec, values):
+    if spec["kind"] == "category":
+        return pd.Categorical(list(values), categories=spec["categories"], ordered=spec["ordered"])
+    if spec["kind"] == "nullable":
+        return pd.array(list(values), dtype=spec["dtype"])
+    if spec["kind"] == "bool":
+        return np.array(values, dtype=bool)
+    if spec["kind"] == "str":
+        return pd.array(list(values), dtype="str")
+    return np.array(values, dtype=spec["dtype"])
@@ -0,0 +1,232 @@
+"""
+Streaming ingest: LOAD/CLEAN/VALIDATION over raw results in chunks
+==================================================================
+For result histories too large to hold as one frame. Each chunk is parsed with the declared
+schema, cleaned and validated, then folded into running aggregates (eligibility counts,
+year x eligibility pivots, per-school counts) and dropped.
+
+Validation uses the full run's rule engine (ncaa_eligibility.validation): the row-local rules
+(ROW_RULES) and null checks run on every chunk, so a chunk with error rows stops the stream with
+the same errors the full run reports; unknown eligibility rows are dropped the same way. The
+cross-row rules (bracket sizes, duplicate places, the per-year unseeded delta) need whole brackets
+and are not run here.
+
+The Report 01 summary prints, tables/eligibility_summary.md and docs/_data/report_stats.json
+match the full run in notebooks/analysis.py.
+
+Usage:
+    python -m ncaa_eligibility.streaming [--data PATH] [--chunksize N]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ncaa_eligibility.artifacts import open_text
+from ncaa_eligibility.ingest import clean_results, resolve_sources
+from ncaa_eligibility.schema import ELIGIBILITY_ORDER, RESULTS_DTYPES
+from ncaa_eligibility.summary import build_report_stats, eligibility_summary_table, print_data_summary
+from ncaa_eligibility.validation import (
+    ROW_RULES, VIOLATION_COLUMNS, drop_invalid, rows_with, validate_results, violation_summary,
+)
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def iter_result_chunks(source, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield cleaned frames of at most chunksize rows from the raw results CSV(s), file by file."""
+    for path in resolve_sources(source):
+        with pd.read_csv(path, dtype=RESULTS_DTYPES, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield clean_results(chunk)
+
+
+def _add(total, part):
+    """Running sum of two count frames/series aligned on their labels (None = empty)."""
+    return part if total is None else total.add(part, fill_value=0)
+
+
+class ResultsAccumulator:
+    """Running validation state and aggregates over cleaned result chunks."""
+
+    def __init__(self):
+        self.n_loaded = 0
+        self.n_records = 0
+        self.year_min = None
+        self.year_max = None
+        self.places = set()
+        self.eligibility_seen = set()
+        self.violations = []  # Per-chunk violation tables (row = label in the chunk's file)
+        self.wrestlers = set()
+        self.aa_counts = np.zeros(len(ELIGIBILITY_ORDER), dtype=np.int64)
+        self.nc_counts = np.zeros(len(ELIGIBILITY_ORDER), dtype=np.int64)
+        self._aa_by_year_elig = None
+        self._nc_by_year_elig = None
+        self._school_aa = None
+        self._school_nc = None
+        self._school_seed_sum = None
+
+    def update(self, chunk):
+        """Validate one cleaned chunk and fold it into the aggregates. Raises ValueError if any row
+        violates an "error" rule, so a bad row stops the stream early."""
+        self.n_loaded += len(chunk)
+        violations = validate_results(chunk, rules=ROW_RULES)
+        self.violations.append(violations)
+
+        chunk_min, chunk_max = int(chunk["Year"].min()), int(chunk["Year"].max())
+        self.year_min = chunk_min if self.year_min is None else min(self.year_min, chunk_min)
+        self.year_max = chunk_max if self.year_max is None else max(self.year_max, chunk_max)
+        self.places |= set(int(p) for p in chunk["Place"].dropna().unique())
+        self.eligibility_seen |= set(chunk["Eligibility Year"].dropna().unique())
+
+        error_rows = rows_with(violations, "error")
+        if len(error_rows):
+            print(violation_summary(violations[violations["severity"] == "error"]).to_string(index=False))
+            raise ValueError(f"Validation failed: {len(error_rows):,} rows violate error rules "
+                             f"(first: row {error_rows[0]})")
+        # Unknown eligibility labels are dropped from the aggregates (reported in print_validation)
+        chunk = drop_invalid(chunk, violations)
+        self.n_records += len(chunk)
+        self.wrestlers.update(chunk["Wrestler"].unique())
+
+        elig_codes = chunk["Eligibility Year"].cat.codes.to_numpy()
+        is_champ = (chunk["Place"] == 1).to_numpy()
+        self.aa_counts += np.bincount(elig_codes, minlength=len(ELIGIBILITY_ORDER))
+        self.nc_counts += np.bincount(elig_codes[is_champ], minlength=len(ELIGIBILITY_ORDER))
+
+        champions = chunk[is_champ]
+        self._aa_by_year_elig = _add(self._aa_by_year_elig, _year_elig_counts(chunk))
+        self._nc_by_year_elig = _add(self._nc_by_year_elig, _year_elig_counts(champions))
+
+        # Chunk categoricals carry chunk-local categories; aggregate on the labels
+        by_school = chunk.groupby("School", observed=True)
+        self._school_aa = _add(self._school_aa, by_school.size())
+        self._school_nc = _add(self._school_nc, champions.groupby("School", observed=True).size())
+        self._school_seed_sum = _add(self._school_seed_sum, by_school["Placement-Seed Delta"].sum())
+
+    # --- Aggregates in the shape the full run computes them ---
+
+    @property
+    def aa_by_eligibility(self):
+        return _eligibility_series(self.aa_counts)
+
+    @property
+    def champs_by_eligibility(self):
+        return _eligibility_series(self.nc_counts)
+
+    @property
+    def aa_by_year_elig(self):
+        return _finish_pivot(self._aa_by_year_elig)
+
+    @property
+    def nc_by_year_elig(self):
+        return _finish_pivot(self._nc_by_year_elig)
+
+    @property
+    def school_stats(self):
+        """School, AA_Count, NC_Count, Seed_Diff_Sum (as built in Report 04)."""
+        stats = pd.DataFrame({
+            "AA_Count": self._school_aa,
+            "NC_Count": self._school_nc,
+            "Seed_Diff_Sum": self._school_seed_sum,
+        }).sort_index()
+        stats["AA_Count"] = stats["AA_Count"].astype(int)
+        stats["NC_Count"] = stats["NC_Count"].fillna(0).astype(int)
+        stats["Seed_Diff_Sum"] = stats["Seed_Diff_Sum"].astype(np.int64)
+        return stats.rename_axis("School").reset_index()
+
+    @property
+    def total_champs(self):
+        return int(self.nc_counts.sum())
+
+    @property
+    def violation_table(self):
+        """Every chunk's row-rule violations, in the validate_results layout."""
+        if not self.violations:
+            return pd.DataFrame(columns=VIOLATION_COLUMNS)
+        return pd.concat(self.violations, ignore_index=True)
+
+    def print_validation(self):
+        """Print the VALIDATION block as the full run does (row-local rules only)."""
+        print(f"  Year range: {self.year_min}-{self.year_max}")
+        print(f"  Places: {sorted(self.places)}")
+        print(f"  Eligibility years: {sorted(self.eligibility_seen)}")
+        violations = self.violation_table
+        if len(violations):
+            print(f"  WARNING: {len(violations):,} violations in {violations['row'].nunique():,} rows:")
+            print(violation_summary(violations).to_string(index=False))
+        else:
+            print("  No violations")
+        if self.n_records < self.n_loaded:
+            print(f"  Filtered to {self.n_records:,} records with valid eligibility")
+
+
+def _year_elig_counts(frame):
+    return frame.groupby(["Year", "Eligibility Year"], observed=True).size().unstack(fill_value=0)
+
+
+def _eligibility_series(counts, drop_empty=True):
+    """Counts in ELIGIBILITY_ORDER, shaped like value_counts(sort=False) on the categorical."""
+    series = pd.Series(counts, index=pd.Index(ELIGIBILITY_ORDER, name="Eligibility Year"), name="count")
+    return series[series > 0] if drop_empty else series
+
+
+def _finish_pivot(pivot):
+    if pivot is None:
+        return pd.DataFrame()
+    pivot = pivot.fillna(0).astype(np.int64).sort_index()
+    return pivot[[e for e in ELIGIBILITY_ORDER if e in pivot.columns]]
+
+
+def stream_results(path, chunksize=DEFAULT_CHUNKSIZE):
+    """Run LOAD/CLEAN/VALIDATION over path in chunks; returns the filled ResultsAccumulator."""
+    acc = ResultsAccumulator()
+    for chunk in iter_result_chunks(path, chunksize):
+        acc.update(chunk)
+    return acc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chunked LOAD/CLEAN/VALIDATION + Report 01 summary")
+    parser.add_argument("--data", type=Path, default=ROOT_DIR / "data" / "raw_data.csv",
+                        help="CSV, directory of CSVs or glob")
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--tables-dir", type=Path, default=ROOT_DIR / "tables")
+    parser.add_argument("--report-data-dir", type=Path, default=ROOT_DIR / "docs" / "_data")
+    args = parser.parse_args(argv)
+
+    print(f"Streaming data in chunks of {args.chunksize:,} rows...")
+    acc = stream_results(args.data, args.chunksize)
+    print(f"Loaded {acc.n_loaded:,} records")
+
+    print("\nRunning validation checks...")
+    acc.print_validation()
+    print_data_summary(acc.n_records, len(acc.wrestlers), acc.year_min, acc.year_max,
+                       _eligibility_series(acc.aa_counts, drop_empty=False))
+
+    summary_df = eligibility_summary_table(acc.aa_by_eligibility, acc.champs_by_eligibility,
+                                           acc.n_records, acc.total_champs)
+    md_table = summary_df.to_markdown(index=False)
+    args.tables_dir.mkdir(parents=True, exist_ok=True)
+    table_path = args.tables_dir / "eligibility_summary.md"
+    with open_text(table_path) as f:
+        f.write("# Eligibility Year Summary\n\n")
+        f.write(md_table)
+    print(f"\nSaved: {table_path}")
+    print("\n" + md_table)
+
+    report_stats = build_report_stats(acc.year_min, acc.year_max, acc.aa_by_eligibility,
+                                      acc.champs_by_eligibility, acc.n_records, acc.total_champs)
+    args.report_data_dir.mkdir(parents=True, exist_ok=True)
+    report_stats_path = args.report_data_dir / "report_stats.json"
+    with open_text(report_stats_path) as f:
+        json.dump(report_stats, f, indent=2)
+    print(f"\nSaved: {report_stats_path}")
+
+
+if __name__ == "__main__":
+    main()
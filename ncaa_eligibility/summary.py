@@ -0,0 +1,74 @@
+"""
+Report 01 summary: data summary prints, eligibility summary table, report_stats.json
+====================================================================================
+Shared by the full run (notebooks/analysis.py) and the streaming ingest so both emit
+identical numbers from the same aggregates.
+"""
+
+import pandas as pd
+
+from ncaa_eligibility.schema import ELIGIBILITY_ORDER
+
+ELIGIBILITY_LABELS = {
+    "Fr": "Freshmen",
+    "So": "Sophomores",
+    "Jr": "Juniors",
+    "Sr": "Seniors",
+    "SSr": "Super Seniors",
+}
+
+
+def print_data_summary(n_records, n_wrestlers, year_min, year_max, eligibility_counts):
+    """Print the post-validation data summary and eligibility distribution."""
+    print(f"\nData summary:")
+    print(f"  Total All-Americans: {n_records:,}")
+    print(f"  Unique wrestlers: {n_wrestlers:,}")
+    print(f"  Year span: {year_max - year_min + 1} years ({year_min}-{year_max})")
+
+    # Eligibility breakdown
+    print(f"\nEligibility Year distribution:")
+    print(eligibility_counts)
+
+
+def eligibility_summary_table(aa_by_eligibility, champs_by_eligibility, total_aa, total_champs):
+    """Table 1: AAs and NCs by eligibility year with shares (one row per class present)."""
+    summary_data = []
+    for elig in ELIGIBILITY_ORDER:
+        if elig in aa_by_eligibility.index:
+            n_aa = int(aa_by_eligibility[elig])
+            champs = int(champs_by_eligibility.get(elig, 0))
+            pct_of_aas = n_aa / total_aa * 100
+            pct_of_ncs = champs / total_champs * 100 if total_champs > 0 else 0
+            summary_data.append({
+                "Eligibility Year": elig,
+                "All-Americans": n_aa,
+                "% of AAs": f"{pct_of_aas:.1f}%",
+                "National Champions": champs,
+                "% of NCs": f"{pct_of_ncs:.1f}%"
+            })
+    return pd.DataFrame(summary_data)
+
+
+def build_report_stats(year_min, year_max, aa_by_eligibility, champs_by_eligibility, total_aa, total_champs):
+    """Payload for docs/_data/report_stats.json (Jekyll site.data.report_stats)."""
+    report_stats = {
+        "year_min": int(year_min),
+        "year_max": int(year_max),
+        "year_range": f"{year_min}–{year_max}",
+        "nc": {},
+        "aa": {},
+    }
+    for elig in ELIGIBILITY_ORDER:
+        nc_count = int(champs_by_eligibility.get(elig, 0))
+        aa_count = int(aa_by_eligibility.get(elig, 0))
+        report_stats["nc"][elig] = {
+            "count": nc_count,
+            "pct": f"{nc_count / total_champs * 100:.1f}" if total_champs else "0",
+            "label": ELIGIBILITY_LABELS[elig],
+        }
+        report_stats["aa"][elig] = {
+            "count": aa_count,
+            "pct": f"{aa_count / total_aa * 100:.1f}" if total_aa else "0",
+            "label": ELIGIBILITY_LABELS[elig],
+        }
+    return report_stats
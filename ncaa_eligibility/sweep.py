@@ -0,0 +1,172 @@
+"""
+Career-window sweep: Report 02 numbers under alternative complete-career definitions
+====================================================================================
+Report 02 counts only complete careers: every AA inside the career window (CAREER_WINDOW, with
+per-class year bounds) and no eligibility left to AA again. This re-runs that filter over a grid
+of windows and Sr completion rules and computes the Report 02 numbers (funnel, multi-AA,
+multi-weight, weight moves, improved every year, archetype counts) for each scenario.
+
+The cleaned data, each wrestler's latest AA and the CareerTable of every wrestler are built once;
+a scenario only recomputes the filter mask and reads its wrestlers out of the shared table
+(CareerTable.select). Scenarios run in a process pool (--workers, default one per core) and
+come back in grid order. Results go to one comparison table, tables/career_window_sweep.md,
+with the full numbers per scenario in tables/career_window_sweep.json.
+
+Usage:
+    python -m ncaa_eligibility.sweep [--windows 1999-2025 2004-2025] [--sr-through any 2020] [--workers N]
+"""
+
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from ncaa_eligibility.artifacts import write_text
+from ncaa_eligibility.careers import (
+    ARCHETYPE_NAMES, CAREER_WINDOW, LAST_CHANCE_NAMES, CareerTable, career_stats, complete_career_ids, latest_aas,
+)
+from ncaa_eligibility.identity import intern_identities
+from ncaa_eligibility.ingest import load_results
+from ncaa_eligibility.validation import drop_invalid, validate_results
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_PATH = ROOT_DIR / "data" / "raw_data.csv"
+CACHE_DIR = ROOT_DIR / "data" / ".cache"
+OUT_PATH = ROOT_DIR / "tables" / "career_window_sweep.md"
+
+DEFAULT_WINDOWS = ["1999-2025", "2004-2025", "2009-2025", "1999-2019"]
+# Sr completion rules: "any" = every Sr career is complete (Report 02); a year = only Sr AAs up to
+# that year are final (later Sr AAs could still come back as SSr)
+DEFAULT_SR_THROUGH = ["any", "2020"]
+
+_state = None  # (df, latest, careers) in this process, set by _use_state
+
+
+def parse_window(text):
+    """"1999-2025" -> (1999, 2025)."""
+    lo, hi = (int(part) for part in text.split("-"))
+    if lo >= hi:
+        raise argparse.ArgumentTypeError(f"window {text}: start must be before end")
+    return lo, hi
+
+
+def parse_sr_through(text):
+    """"any" -> None, else the last Sr AA year counted as final."""
+    return None if text == "any" else int(text)
+
+
+def scenario_grid(windows, sr_throughs):
+    """Every (window, sr_complete_through) pair, windows first."""
+    return list(itertools.product(windows, sr_throughs))
+
+
+def build_state(df):
+    """What every scenario shares: the cleaned frame, each wrestler's latest AA and all careers."""
+    return df, latest_aas(df), CareerTable(df)
+
+
+def run_scenario(scenario):
+    """Report 02 numbers for one (window, sr_complete_through) over the shared state."""
+    window, sr_complete_through = scenario
+    df, latest, careers = _state
+    wrestler_ids = complete_career_ids(df, window, sr_complete_through, latest=latest)
+    return {
+        "window": list(window),
+        "sr_complete_through": sr_complete_through,
+        "stats": career_stats(careers.select(wrestler_ids)),
+    }
+
+
+def run_sweep(df, scenarios, workers=None):
+    """run_scenario for each scenario, in a pool of `workers` processes (None = one per core; 1 =
+    in this process). Results are in scenario order."""
+    state = build_state(df)
+    workers = min(workers or os.cpu_count() or 1, len(scenarios))
+    if workers <= 1:
+        _use_state(state)
+        return [run_scenario(s) for s in scenarios]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_use_state, initargs=(state,)) as pool:
+        return list(pool.map(run_scenario, scenarios))
+
+
+def comparison_table(results):
+    """One row per scenario: the headline Report 02 numbers and archetype totals."""
+    rows = []
+    for result in results:
+        stats, moves = result["stats"], result["stats"]["weight_move_stats"]
+        lo, hi = result["window"]
+        sr = result["sr_complete_through"]
+        row = {
+            "Window": f"{lo}-{hi}",
+            "Sr complete": "any" if sr is None else f"≤{sr}",
+            "Careers": stats["n_complete_careers"],
+            "Multi-AA": stats["n_multi_aa"],
+        }
+        row.update({f"{k}× AA": stats["funnel"][f"n_{k}plus"] for k in range(1, 5)})
+        row["5+× AA"] = stats["funnel"]["n_5plus"]
+        row["Multi-weight"] = stats["n_multi_weight_aa"]
+        row["Moves"] = moves.get("n_transitions", 0)
+        row["Up improved %"] = moves.get("pct_up_improved", 0)
+        row["Down improved %"] = moves.get("pct_down_improved", 0)
+        row["Improved every year"] = stats["n_improved_every_year"]
+        row.update({name: stats["archetypes"][name]["total"] for name in ARCHETYPE_NAMES})
+        row.update({name: stats["archetypes"]["Last Chance"][name]["total"] for name in LAST_CHANCE_NAMES})
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def load_clean(data_path, cache_dir=CACHE_DIR):
+    """Cleaned, validated results with Wrestler_ID (as the analysis's load and clean stages)."""
+    df, _ = load_results(data_path, cache_dir=cache_dir)
+    df = drop_invalid(df, validate_results(df))
+    intern_identities(df)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report 02 numbers across career-window definitions.")
+    parser.add_argument("--data", type=Path, default=DATA_PATH,
+                        help="Results CSV, directory of CSVs or glob (default: data/raw_data.csv)")
+    parser.add_argument("--windows", type=parse_window, nargs="+", default=[parse_window(w) for w in DEFAULT_WINDOWS],
+                        help=f"Career windows as START-END (default: {' '.join(DEFAULT_WINDOWS)})")
+    parser.add_argument("--sr-through", type=parse_sr_through, nargs="+",
+                        default=[parse_sr_through(s) for s in DEFAULT_SR_THROUGH],
+                        help="Sr completion rules: any, or the last Sr AA year counted as final "
+                             f"(default: {' '.join(DEFAULT_SR_THROUGH)})")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: one per core)")
+    parser.add_argument("--out", type=Path, default=OUT_PATH,
+                        help="Comparison table path; the .json goes next to it (default: tables/career_window_sweep.md)")
+    args = parser.parse_args(argv)
+
+    df = load_clean(args.data)
+    scenarios = scenario_grid(args.windows, args.sr_through)
+    print(f"Sweeping {len(scenarios)} scenarios over {df['Wrestler_ID'].nunique():,} wrestlers...")
+    results = run_sweep(df, scenarios, args.workers)
+
+    table = comparison_table(results)
+    print("\n" + table.to_string(index=False))
+    lo, hi = CAREER_WINDOW
+    md = (
+        "# Report 02 across career-window definitions\n\n"
+        f"*Report 02 uses window {lo}-{hi} with every Sr career complete (Sr complete = any). "
+        "Sr complete ≤ YEAR counts a Sr career only if its Sr AA was in or before YEAR.*\n\n"
+        + table.to_markdown(index=False) + "\n"
+    )
+    json_path = args.out.with_suffix(".json")
+    write_text(args.out, md)
+    write_text(json_path, json.dumps(results, indent=2))
+    print(f"Saved: {args.out}")
+    print(f"Saved: {json_path}")
+
+
+def _use_state(state):
+    global _state
+    _state = state
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Synthetic tournament results in the raw_data.csv schema, at any scale
+=====================================================================
+For benchmarking the pipeline beyond the real 2,000-row history. Years are the real ones
+(2000-2025, no 2020 tournament) because the reports are built around that window; scale
+multiplies the brackets per year instead: scale 1 is the 10 real weight classes, scale N adds
+N - 1 more divisions of 10 (weights 1000+), so rows grow linearly with scale.
+
+Each (Year, Weight) bracket has 8 placers. Entrants are seeded to the era's seed count (12
+through 2013, 16 through 2018, 33 from 2019; the rest unseeded, "US") and finish in order of
+seed plus noise, which gives about the real data's chalk: placers a couple of places from
+their seed. Careers carry over: a placer with eligibility left places again the next year
+(sometimes the year after) with a probability that rises with their finish, one class older,
+usually at the same weight and sometimes one up or down, for the same school. Newcomers start
+at any class, mostly Jr/Sr as in the real data; Sr placers can come back as SSr from 2021.
+Schools come from data/schools.json with a few programs far more likely than the rest.
+
+Placement-Seed Delta, AAs (the wrestler's total) and Progression Eligible follow the same rules
+as the real data, so validation passes.
+
+Usage:
+    python -m ncaa_eligibility.synthetic --scale 10 [--seed 0] [--out PATH]
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ncaa_eligibility.schema import ELIGIBILITY_ORDER, UNSEEDED
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SCHOOLS_JSON_PATH = ROOT_DIR / "data" / "schools.json"
+
+YEARS = [year for year in range(2000, 2026) if year != 2020]
+WEIGHTS = [125, 133, 141, 149, 157, 165, 174, 184, 197, 285]
+PLACERS = 8
+ENTRANTS = 33
+
+# Seeds per bracket by era; the rest of the field is unseeded
+SEED_ERAS = [(2013, 12), (2018, 16), (9999, 33)]
+SEED_NOISE = 3.0            # sd of (finish rank - seed) for seeded entrants
+UNSEEDED_STRENGTH = (4, 5)  # unseeded entrants rank like seed cap + 4 +/- 5
+
+# Class of first-time placers (Fr, So, Jr, Sr)
+NEW_ELIGIBILITY_P = [0.22, 0.26, 0.30, 0.22]
+# Chance a placer places again next year, by place (1st..8th); a smaller chance the year after
+RETURN_P = np.array([0.85, 0.8, 0.75, 0.7, 0.66, 0.62, 0.6, 0.58])
+RETURN_LATER_P = 0.12
+SSR_RETURN_P = 0.4          # Sr placers returning as SSr (COVID year, 2021+)
+WEIGHT_MOVE_P = [0.12, 0.74, 0.14]  # down / same / up one weight
+SCHOOL_ZIPF = 1.1
+
+FIRST_NAMES = [
+    "Aaron", "Alex", "Andrew", "Ben", "Brandon", "Brent", "Cael", "Carter", "Chris", "Cody",
+    "Cole", "Dan", "David", "Derek", "Drew", "Dustin", "Evan", "Gable", "Grant", "Jake",
+    "James", "Jason", "Jordan", "Josh", "Justin", "Kyle", "Logan", "Luke", "Mark", "Matt",
+    "Max", "Michael", "Mitchell", "Nick", "Noah", "Pat", "Quentin", "Ryan", "Sam", "Seth",
+    "Spencer", "Steve", "Tanner", "Tom", "Troy", "Tyler", "Vito", "Wade", "Zach", "Zain",
+]
+LAST_NAMES = [
+    "Anderson", "Bailey", "Brands", "Burroughs", "Carr", "Cox", "Dake", "Diakomihalis", "Dresser",
+    "Ferrari", "Foley", "Gilman", "Green", "Hall", "Hamiti", "Hendrickson", "Howe", "Jordan",
+    "Keckeisen", "Kolodzik", "Lee", "Lewis", "Martinez", "McKenna", "Metcalf", "Miller",
+    "Moore", "Nickal", "Nolf", "Parker", "Pletcher", "Ramos", "Retherford", "Robinson", "Ruth",
+    "Sanderson", "Snyder", "Starocci", "Steveson", "Taylor", "Thomas", "Valencia", "Van Ness",
+    "Welch", "Whitmer", "Wilson", "Wright", "Young", "Zadick", "Zeerip",
+]
+
+
+def generate_results(scale=1, seed=0, schools_path=SCHOOLS_JSON_PATH):
+    """Synthetic results frame with the raw_data.csv columns: 8 placers per bracket, 10 * scale
+    brackets per year. Same scale and seed give the same frame."""
+    rng = np.random.default_rng(seed)
+    weights = np.array(WEIGHTS + [1000 + i for i in range(10 * (scale - 1))], dtype=np.int64)
+    n_brackets = len(weights)
+    with open(schools_path) as f:
+        schools = np.array([s["school"] for s in json.load(f)], dtype=object)
+    school_p = 1.0 / np.arange(1, len(schools) + 1) ** SCHOOL_ZIPF
+    school_p /= school_p.sum()
+    school_order = rng.permutation(len(schools))
+
+    # Per-wrestler state (grown as newcomers appear)
+    w_school = np.empty(0, dtype=np.int64)
+    w_elig = np.empty(0, dtype=np.int64)
+    w_weight = np.empty(0, dtype=np.int64)
+    w_place = np.empty(0, dtype=np.int64)
+    w_year = np.empty(0, dtype=np.int64)   # Index into YEARS of the last tournament placed
+
+    frames = []
+    for t, year in enumerate(YEARS):
+        cap = next(n for last_year, n in SEED_ERAS if year <= last_year)
+        seed_of, place_of = _bracket_finish(rng, n_brackets, cap)
+
+        # Returning placers: last placed at the previous tournament, or (less often) the one before
+        ids = np.flatnonzero(w_year >= t - 2)
+        last = w_year[ids] == t - 1
+        p = np.where(last, RETURN_P[w_place[ids] - 1], RETURN_LATER_P)
+        elig = w_elig[ids] + np.where(last, 1, 2)
+        ssr = (elig == 4) & (year >= 2021)
+        p = np.where(elig <= 3, p, np.where(ssr, p * SSR_RETURN_P, 0.0))
+        back = rng.random(len(ids)) < p
+        ids, elig = ids[back], elig[back]
+        division, offset = np.divmod(w_weight[ids], 10)
+        offset = np.clip(offset + rng.choice([-1, 0, 1], size=len(ids), p=WEIGHT_MOVE_P), 0, 9)
+        bracket = division * 10 + offset
+
+        # At most PLACERS returners per bracket, in random slots; newcomers fill the rest
+        order = np.lexsort((rng.random(len(ids)), bracket))
+        ids, elig, bracket = ids[order], elig[order], bracket[order]
+        first = np.searchsorted(bracket, bracket)
+        rank = np.arange(len(ids)) - first
+        keep = rank < PLACERS
+        ids, elig, bracket, rank = ids[keep], elig[keep], bracket[keep], rank[keep]
+        slots = np.argsort(rng.random((n_brackets, PLACERS)), axis=1)
+        wrestler = np.full((n_brackets, PLACERS), -1, dtype=np.int64)
+        eligibility = np.zeros((n_brackets, PLACERS), dtype=np.int64)
+        wrestler[bracket, slots[bracket, rank]] = ids
+        eligibility[bracket, slots[bracket, rank]] = elig
+
+        new = wrestler == -1
+        n_new = int(new.sum())
+        new_ids = np.arange(len(w_school), len(w_school) + n_new)
+        wrestler[new] = new_ids
+        eligibility[new] = rng.choice(4, size=n_new, p=NEW_ELIGIBILITY_P)
+        w_school = np.concatenate([w_school, school_order[rng.choice(len(schools), size=n_new, p=school_p)]])
+        w_elig = np.concatenate([w_elig, np.zeros(n_new, dtype=np.int64)])
+        w_weight = np.concatenate([w_weight, np.zeros(n_new, dtype=np.int64)])
+        w_place = np.concatenate([w_place, np.zeros(n_new, dtype=np.int64)])
+        w_year = np.concatenate([w_year, np.full(n_new, -1, dtype=np.int64)])
+
+        flat = wrestler.ravel()
+        w_year[flat] = t
+        w_elig[flat] = eligibility.ravel()
+        w_weight[flat] = np.repeat(np.arange(n_brackets), PLACERS)
+        w_place[flat] = place_of.ravel()
+
+        frames.append(pd.DataFrame({
+            "Year": year,
+            "Weight": np.repeat(weights, PLACERS),
+            "Place": place_of.ravel(),
+            "Wrestler_ID": flat,
+            "Seed_Int": seed_of.ravel(),
+            "Unseeded_Value": cap + 1,
+            "Elig": eligibility.ravel(),
+        }))
+
+    df = pd.concat(frames, ignore_index=True).sort_values(["Year", "Weight", "Place"], kind="stable")
+    unseeded = df["Seed_Int"] == 0
+    aa_counts = np.bincount(df["Wrestler_ID"], minlength=len(w_school))
+    return pd.DataFrame({
+        "Index": np.arange(1, len(df) + 1),
+        "Year": df["Year"].to_numpy(),
+        "Weight": df["Weight"].to_numpy(),
+        "Place": df["Place"].to_numpy(),
+        "Wrestler": _names(df["Wrestler_ID"].to_numpy()),
+        "School": schools[w_school[df["Wrestler_ID"].to_numpy()]],
+        "Seed": np.where(unseeded, UNSEEDED, df["Seed_Int"].astype(str)),
+        "Placement-Seed Delta": np.where(unseeded, df["Unseeded_Value"], df["Seed_Int"]) - df["Place"],
+        "Eligibility Year": np.array(ELIGIBILITY_ORDER, dtype=object)[df["Elig"].to_numpy()],
+        "Progression Eligible": np.where(df["Year"] - df["Elig"] >= YEARS[0], "TRUE", "FALSE"),
+        "AAs": aa_counts[df["Wrestler_ID"].to_numpy()],
+    })
+
+
+def write_results(path, scale=1, seed=0):
+    """generate_results written as CSV to path; returns the row count."""
+    df = generate_results(scale, seed)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, index=False)
+    return len(df)
+
+
+def _bracket_finish(rng, n_brackets, cap):
+    """Seed (0 = unseeded) and place of each bracket's 8 placers, shape (n_brackets, 8).
+    Every entrant gets a finish score (seed + noise; unseeded a little below the bottom seed) and the
+    8 lowest scores place, in order."""
+    n_unseeded = ENTRANTS - cap
+    seeded = np.arange(1, cap + 1) + rng.normal(0, SEED_NOISE, size=(n_brackets, cap))
+    loc, spread = UNSEEDED_STRENGTH
+    unseeded = cap + loc + rng.normal(0, spread, size=(n_brackets, n_unseeded))
+    scores = np.concatenate([seeded, unseeded], axis=1)
+    entrant = np.argsort(scores, axis=1)[:, :PLACERS]
+    seed_of = np.where(entrant < cap, entrant + 1, 0)
+    place_of = np.broadcast_to(np.arange(1, PLACERS + 1), seed_of.shape)
+    return seed_of, place_of
+
+
+def _names(ids):
+    """Unique display names: first + last, with a numeral once the combinations run out."""
+    n_first, n_last = len(FIRST_NAMES), len(LAST_NAMES)
+    first = np.array(FIRST_NAMES, dtype=object)[ids % n_first]
+    last = np.array(LAST_NAMES, dtype=object)[(ids // n_first) % n_last]
+    names = first + " " + last
+    repeat = ids // (n_first * n_last)
+    suffixed = repeat > 0
+    names[suffixed] = names[suffixed] + " " + (repeat[suffixed] + 1).astype(str)
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic NCAA results in the raw_data.csv schema.")
+    parser.add_argument("--scale", type=int, default=1, help="Brackets per year = 10 x scale (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--out", type=Path, default=None,
+                        help="CSV path (default: data/synthetic/results_<scale>x.csv)")
+    args = parser.parse_args(argv)
+
+    out = args.out or ROOT_DIR / "data" / "synthetic" / f"results_{args.scale}x.csv"
+    n_rows = write_results(out, args.scale, args.seed)
+    print(f"Saved: {out} ({n_rows:,} rows)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+Section tracing: wall time, CPU time, peak RSS and rows per named section
+=========================================================================
+Pipeline runs every stage inside section(stage name). Within a long stage, phase(name) closes
+the stage's current phase and opens the next one, so a report can be split into sections
+(funnel, weight changes, archetypes, ...) without re-indenting its body:
+
+    phase("archetypes", rows=len(df_filtered))
+
+Each finished section is an event with its wall and CPU seconds, the process's peak RSS when
+it ended and the rows it processed (record_rows sets that for the innermost open section).
+Events stay in the process that recorded them until take_events(); pool workers hand theirs
+back with the stage's result. write_trace writes them as a JSON trace and in Chrome trace
+format (load trace.chrome.json in chrome://tracing or https://ui.perfetto.dev for a flame view).
+
+Memory mode (enable_memory, opt-in: tracemalloc slows the traced code several times) adds to
+every section the memory traced and the process RSS at its end, and the change in traced memory
+over it; stages also get their traced peak and the top allocation sites still holding memory
+at the stage's end (snapshot diff against its start). record_size(name, obj) records the bytes
+held by a named intermediate frame (deep memory_usage) in the current phase. write_memory_report
+turns those into trace/memory.md.
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: no peak RSS
+    resource = None
+
+from ncaa_eligibility.artifacts import write_text
+
+_open = []    # Stack of sections being recorded in this process
+_events = []  # Finished sections not yet taken
+_memory_top = None  # Allocation sites kept per stage in memory mode (None = memory mode off)
+MB = 1024 * 1024
+# Event fields shown as args in the Chrome trace
+CHROME_ARGS = ("cpu_s", "peak_rss_mb", "rows", "parent", "mem_current_mb", "mem_peak_mb", "rss_mb", "retained_mb")
+
+
+@contextlib.contextmanager
+def section(name, rows=None, cat="section"):
+    """Record the enclosed block as section name (nested sections get it as parent)."""
+    event = _start(name, cat, rows, parent=_open[-1]["name"] if _open else None)
+    _open.append(event)
+    try:
+        yield event
+    finally:
+        _end_phase(event)
+        _open.pop()
+        _finish(event)
+
+
+def phase(name, rows=None):
+    """End the current phase of the innermost section and start phase name (no-op untraced)."""
+    if not _open:
+        return
+    parent = _open[-1]
+    _end_phase(parent)
+    parent["_phase"] = _start(name, "phase", rows, parent=parent["name"])
+
+
+def record_rows(rows):
+    """Set the rows processed by the innermost open section."""
+    if _open:
+        _open[-1]["rows"] = int(rows)
+
+
+def enable_memory(top=10):
+    """Turn on memory mode for the sections started from now on in this process."""
+    global _memory_top
+    _memory_top = top
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def record_size(name, obj):
+    """In memory mode, record the bytes held by obj (a frame, series or any object) as name on
+    the innermost open section's current phase. No-op otherwise."""
+    if _memory_top is None or not _open:
+        return
+    target = _open[-1].get("_phase") or _open[-1]
+    target.setdefault("retained_mb", {})[name] = round(_nbytes(obj) / MB, 3)
+
+
+def take_events():
+    """Finished events recorded in this process since the last call."""
+    events = list(_events)
+    _events.clear()
+    return events
+
+
+def write_trace(events, directory):
+    """Write events to directory/trace.json and directory/trace.chrome.json; returns both paths."""
+    directory = Path(directory)
+    events = sorted(events, key=lambda e: e["start"])
+    t0 = events[0]["start"] if events else 0.0
+    sections = [
+        {**{k: v for k, v in e.items() if k != "start"}, "start_s": round(e["start"] - t0, 6)}
+        for e in events
+    ]
+    chrome = [
+        {
+            "name": e["name"],
+            "cat": e["cat"],
+            "ph": "X",
+            "ts": round((e["start"] - t0) * 1e6),
+            "dur": round(e["wall_s"] * 1e6),
+            "pid": e["pid"],
+            "tid": e["pid"],
+            "args": {k: e[k] for k in CHROME_ARGS if e.get(k) is not None},
+        }
+        for e in events
+    ]
+    json_path = directory / "trace.json"
+    chrome_path = directory / "trace.chrome.json"
+    write_text(json_path, json.dumps({"sections": sections}, indent=2))
+    write_text(chrome_path, json.dumps({"traceEvents": chrome, "displayTimeUnit": "ms"}))
+    return json_path, chrome_path
+
+
+def write_memory_report(events, path):
+    """Markdown summary of a memory-mode trace: per section traced/RSS memory, then each stage's
+    top allocation sites and the named intermediates' sizes. Returns path."""
+    events = [e for e in sorted(events, key=lambda e: e["start"]) if "mem_current_mb" in e]
+    lines = [
+        "# Memory by section",
+        "",
+        "| Section | Traced at end (MB) | Change (MB) | Stage peak (MB) | RSS at end (MB) | Peak RSS (MB) |",
+        "|---|---|---|---|---|---|",
+    ]
+    for e in events:
+        label = e["name"] if e["cat"] == "stage" else f"{e['parent']} / {e['name']}"
+        cells = [e["mem_current_mb"], e["mem_change_mb"], e.get("mem_peak_mb"), e["rss_mb"], e["peak_rss_mb"]]
+        lines.append("| " + " | ".join([label] + ["" if c is None else f"{c:,.1f}" for c in cells]) + " |")
+
+    retained = [(e, name, mb) for e in events for name, mb in e.get("retained_mb", {}).items()]
+    if retained:
+        lines += ["", "# Named intermediates", "", "| Section | Object | Size (MB) |", "|---|---|---|"]
+        for e, name, mb in retained:
+            label = e["name"] if e["cat"] == "stage" else f"{e['parent']} / {e['name']}"
+            lines.append(f"| {label} | `{name}` | {mb:,.3f} |")
+
+    for e in events:
+        if e.get("top_allocations"):
+            lines += ["", f"# Top allocation sites: {e['name']}", "", "| Site | Held (MB) | Blocks |", "|---|---|---|"]
+            lines += [f"| `{a['site']}` | {a['size_mb']:,.3f} | {a['count']:,} |" for a in e["top_allocations"]]
+    write_text(path, "\n".join(lines) + "\n")
+    return path
+
+
+def _start(name, cat, rows, parent):
+    event = {
+        "name": name,
+        "cat": cat,
+        "parent": parent,
+        "pid": os.getpid(),
+        "start": time.time(),
+        "rows": None if rows is None else int(rows),
+        "_wall": time.perf_counter(),
+        "_cpu": time.process_time(),
+    }
+    if _memory_top is not None:
+        if cat == "stage":
+            tracemalloc.reset_peak()
+            event["_snapshot"] = _snapshot()
+        event["_traced"] = tracemalloc.get_traced_memory()[0]
+    return event
+
+
+def _end_phase(event):
+    current = event.pop("_phase", None)
+    if current is not None:
+        _finish(current)
+
+
+def _finish(event):
+    event["wall_s"] = round(time.perf_counter() - event.pop("_wall"), 6)
+    event["cpu_s"] = round(time.process_time() - event.pop("_cpu"), 6)
+    event["peak_rss_mb"] = _peak_rss_mb()
+    if "_traced" in event:
+        traced, peak = tracemalloc.get_traced_memory()
+        event["mem_current_mb"] = round(traced / MB, 1)
+        event["mem_change_mb"] = round((traced - event.pop("_traced")) / MB, 1)
+        event["rss_mb"] = _rss_mb()
+        if "_snapshot" in event:
+            event["mem_peak_mb"] = round(peak / MB, 1)
+            event["top_allocations"] = _top_allocations(event.pop("_snapshot"), _snapshot(), _memory_top)
+    _events.append(event)
+
+
+def _snapshot():
+    """tracemalloc snapshot without tracemalloc's own and the import system's allocations."""
+    return tracemalloc.take_snapshot().filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+    ])
+
+
+def _top_allocations(before, after, top):
+    """The top allocation sites (file:line) by memory gained between two snapshots."""
+    stats = [s for s in after.compare_to(before, "lineno") if s.size_diff > 0][:top]
+    return [
+        {
+            "site": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+            "size_mb": round(s.size_diff / MB, 3),
+            "count": s.count_diff,
+        }
+        for s in stats
+    ]
+
+
+def _nbytes(obj):
+    """Deep size of a pandas object (memory_usage(deep=True)), else sys.getsizeof."""
+    if hasattr(obj, "memory_usage"):
+        usage = obj.memory_usage(deep=True)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    return sys.getsizeof(obj)
+
+
+def _rss_mb():
+    """Current resident set size of this process in MB (Linux /proc; None elsewhere)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return round(pages * os.sysconf("SC_PAGE_SIZE") / MB, 1)
+
+
+def _peak_rss_mb():
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return round(peak / (MB if sys.platform == "darwin" else 1024), 1)
@@ -0,0 +1,180 @@
+"""
+Vectorized validation of the cleaned results frame
+==================================================
+Every rule is a boolean mask over the whole frame (True = violation), so one pass reports
+every problem instead of stopping at the first bad row. The result is a violations table
+with one row per (row, rule):
+
+    row       index label of the offending row in the validated frame
+    rule      rule name (see RULES)
+    severity  "error" (run cannot continue), "drop" (row is excluded) or "warning"
+    column    column the rule checks
+    value     offending value, as text
+    message   what the rule expects
+
+ROW_RULES are the rules that look at one row at a time; they (and the null checks) give the same
+result on any split of the rows, so chunked ingest (ncaa_eligibility.streaming) runs them per chunk.
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from ncaa_eligibility.schema import ELIGIBILITY_DTYPE, ELIGIBILITY_ORDER, KEY_DTYPES, UNSEEDED
+
+# Dataset bounds. Years run through the current calendar year, so a new season validates as soon as
+# it is wrestled; pass year_range to validate_results for other bounds.
+YEAR_RANGE = (1999, date.today().year)
+PLACE_RANGE = (1, 8)
+SEED_RANGE = (1, 33)
+PLACERS_PER_BRACKET = 8
+# Interned into IDs (ncaa_eligibility.identity), which needs a name on every row
+NAME_COLUMNS = ("Wrestler", "School")
+
+VIOLATION_COLUMNS = ["row", "rule", "severity", "column", "value", "message"]
+
+
+# Missing years and places are reported by the null check (an error for KEY_DTYPES columns)
+def _year_rule(year_range):
+    """The year_range rule for the given (first, last) years."""
+    lo, hi = year_range
+
+    def check(df):
+        return ~df["Year"].between(lo, hi).fillna(True), None
+
+    return ("Year", "error", f"Year must be within {lo}-{hi}", check)
+
+
+def _place_range(df):
+    lo, hi = PLACE_RANGE
+    return ~df["Place"].between(lo, hi).fillna(True), None
+
+
+def _eligibility(df):
+    return ~df["Eligibility Year"].isin(ELIGIBILITY_ORDER), None
+
+
+def _seed(df):
+    lo, hi = SEED_RANGE
+    seeded_ok = df["Seed_Int"].between(lo, hi).fillna(False).astype(bool)
+    return ~(df["Unseeded"] | seeded_ok), None
+
+
+def _bracket_size(df):
+    size = df.groupby(["Year", "Weight"])["Place"].transform("size")
+    return size != PLACERS_PER_BRACKET, size.astype(str) + " placers"
+
+
+def _bracket_places(df):
+    duplicated = df.duplicated(["Year", "Weight", "Place"], keep=False)
+    return duplicated, None
+
+
+def _delta(df):
+    """Seeded: Delta == Seed - Place. Unseeded: Delta + Place is the year's unseeded value
+    (one value per year, above every seed that year)."""
+    delta = df["Placement-Seed Delta"]
+    implied = delta + df["Place"]
+    seeded = df["Seed_Int"].notna()
+    bad_seeded = seeded & (implied != df["Seed_Int"].astype("float64"))
+
+    unseeded = ~seeded & df["Unseeded"]
+    year = df["Year"]
+    # Expected unseeded value per year = most common implied value (smallest on ties)
+    counts = implied[unseeded].groupby([year[unseeded].rename("Year"), implied[unseeded].rename("Implied")]).size()
+    expected = (
+        counts.reset_index(name="n")
+        .sort_values(["Year", "n"], ascending=[True, False], kind="stable")
+        .drop_duplicates("Year")
+        .set_index("Year")["Implied"]
+    )
+    # Out-of-range seeds are reported by the seed rule; keep them from shifting every unseeded row
+    seed = df["Seed_Int"].astype("float64")
+    max_seed = seed.where(seed.between(*SEED_RANGE)).groupby(year).max()
+    expected_row = year.map(expected)
+    bad_unseeded = unseeded & ((implied != expected_row) | (implied <= year.map(max_seed).fillna(0)))
+
+    values = delta.astype(str) + " (Seed " + df["Seed"].astype(str) + ", Place " + df["Place"].astype(str) + ")"
+    return (bad_seeded | bad_unseeded).fillna(False).astype(bool), values
+
+
+# name -> (column, severity, message, check). check(df) returns (mask, values or None).
+RULES = {
+    "year_range": _year_rule(YEAR_RANGE),
+    "place_range": ("Place", "error", f"Place must be {PLACE_RANGE[0]}-{PLACE_RANGE[1]} (All-Americans)",
+                    _place_range),
+    "eligibility": ("Eligibility Year", "drop", f"Eligibility Year must be one of {ELIGIBILITY_ORDER}",
+                    _eligibility),
+    "seed": ("Seed", "warning", f"Seed must be {SEED_RANGE[0]}-{SEED_RANGE[1]} or {UNSEEDED!r}", _seed),
+    "bracket_size": ("Place", "warning", f"Each (Year, Weight) bracket must have exactly {PLACERS_PER_BRACKET} placers",
+                     _bracket_size),
+    "bracket_duplicate_place": ("Place", "warning", "Each place appears once per (Year, Weight) bracket",
+                                _bracket_places),
+    "seed_delta": ("Placement-Seed Delta", "warning",
+                   "Delta must be Seed - Place (unseeded: the year's unseeded value - Place)", _delta),
+}
+
+
+ROW_RULES = ("year_range", "place_range", "eligibility", "seed")
+
+
+def validate_results(df, rules=None, year_range=YEAR_RANGE):
+    """Run the named rules (default: every rule) plus per-column null checks over df; returns the
+    violations table. year_range = (first, last) years the year_range rule accepts. A missing Year,
+    Weight or Place is an error (the row cannot be placed in a bracket), as is a missing Wrestler or
+    School (the row cannot be interned); other missing values are warnings."""
+    checks = {**RULES, "year_range": _year_rule(year_range)}
+    parts = []
+    for name in RULES if rules is None else rules:
+        column, severity, message, check = checks[name]
+        mask, values = check(df)
+        parts.append(_violations(df, mask, name, severity, column, message, values))
+    # Seed_Int is <NA> for unseeded wrestlers by design
+    for column in df.columns.drop("Seed_Int"):
+        mask = df[column].isna()
+        if mask.any():
+            severity = "error" if column in KEY_DTYPES or column in NAME_COLUMNS else "warning"
+            parts.append(_violations(df, mask, "null", severity, column, "Value is missing", None))
+    violations = pd.concat(parts, ignore_index=True)
+    return violations.sort_values(["row", "rule"], kind="stable", ignore_index=True)
+
+
+def _violations(df, mask, rule, severity, column, message, values):
+    mask = mask.fillna(False).to_numpy(dtype=bool)
+    source = df[column] if values is None else values
+    return pd.DataFrame({
+        "row": df.index[mask],
+        "rule": rule,
+        "severity": severity,
+        "column": column,
+        "value": source[mask].astype(str).to_numpy(),
+        "message": message,
+    }, columns=VIOLATION_COLUMNS)
+
+
+def rows_with(violations, severity):
+    """Index labels of rows that violate at least one rule of the given severity."""
+    return pd.Index(violations.loc[violations["severity"] == severity, "row"].unique())
+
+
+def drop_invalid(df, violations):
+    """df ready for analysis: raises ValueError if any row violates an "error" rule, otherwise
+    returns df without the "drop" rows (unknown eligibility), eligibility re-cast to the declared
+    categorical and Year/Weight/Place cast to KEY_DTYPES. df itself is not modified."""
+    error_rows = rows_with(violations, "error")
+    if len(error_rows):
+        raise ValueError(f"Validation failed: {len(error_rows):,} rows violate error rules")
+    drop_rows = rows_with(violations, "drop")
+    if len(drop_rows):
+        df = df.drop(index=drop_rows)
+        df["Eligibility Year"] = df["Eligibility Year"].astype(ELIGIBILITY_DTYPE)
+    return df.astype(KEY_DTYPES)
+
+
+def violation_summary(violations):
+    """Count of violating rows per (rule, severity, column), in RULES order."""
+    if len(violations) == 0:
+        return pd.DataFrame(columns=["rule", "severity", "column", "rows"])
+    order = {name: i for i, name in enumerate([*RULES, "null"])}
+    summary = violations.groupby(["rule", "severity", "column"], sort=False).size().reset_index(name="rows")
+    return summary.sort_values("rule", key=lambda s: s.map(order), kind="stable", ignore_index=True)
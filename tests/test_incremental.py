@@ -0,0 +1,42 @@
+"""Appending seasons to the persisted aggregates (ncaa_eligibility.incremental)."""
+
+from pathlib import Path
+
+import pytest
+
+from ncaa_eligibility.incremental import IncrementalAggregates
+from ncaa_eligibility.ingest import clean_results, read_results
+from ncaa_eligibility.validation import YEAR_RANGE
+
+RAW_DATA = Path(__file__).resolve().parent.parent / "data" / "raw_data.csv"
+
+
+@pytest.fixture(scope="module")
+def season():
+    """The last season of raw_data.csv (one year of cleaned rows)."""
+    df = clean_results(read_results(RAW_DATA))
+    return df[df["Year"] == df["Year"].max()]
+
+
+def as_year(rows, year):
+    return rows.assign(Year=year).astype({"Year": rows["Year"].dtype})
+
+
+def test_append_year_after_year_range(season, tmp_path):
+    last = YEAR_RANGE[1]
+    aggregates = IncrementalAggregates.build(as_year(season, last))
+    aggregates.save(tmp_path)
+
+    aggregates = IncrementalAggregates.load(tmp_path)
+    change = aggregates.append_year(as_year(season, last + 1))
+    assert change["year"] == last + 1
+    assert change["rows"] == len(season)
+    assert aggregates.years == [last, last + 1]
+    assert aggregates.year_elig_pivot().loc[last + 1].sum() == len(season)
+
+
+def test_append_year_outside_given_range(season):
+    aggregates = IncrementalAggregates.build(as_year(season, YEAR_RANGE[1]))
+    with pytest.raises(ValueError, match="Validation failed"):
+        aggregates.append_year(as_year(season, YEAR_RANGE[1] + 2), year_range=(YEAR_RANGE[0], YEAR_RANGE[1] + 1))
+    assert aggregates.years == [YEAR_RANGE[1]]